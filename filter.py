@@ -1,15 +1,75 @@
+import time
+
+import bpy
+
+from .utils.cache import LRUCache
+
 EMPTY = 0
-_filter_list_cache = {}
-_filtered_objects_cache = {}
-_filter_visibility_state_cache = {}
+_LIGHT_SOURCE_SCAN_SLICE_SECONDS = 0.005
+_LIGHT_SOURCE_SCAN_INTERVAL = 0.01
+_filter_list_cache = LRUCache("filter_list", 16)
+_filtered_objects_cache = LRUCache("filtered_objects", 16)
+_filter_visibility_state_cache = LRUCache("filter_visibility_state", 16)
 _filter_cache_generation = 0
+_light_source_scan = None
+
+
+class _FilterListEntry:
+    """Cached list flags plus the lookups needed to patch them from depsgraph deltas."""
+    __slots__ = (
+        "scene_pointer",
+        "objects",
+        "index",
+        "flags",
+        "filter_type",
+        "link_type",
+        "search_depth",
+        "bitflag",
+        "material_users",
+    )
+
+    def __init__(self, scene_pointer, objects, filter_type, link_type, search_depth, bitflag):
+        self.scene_pointer = scene_pointer
+        self.objects = objects
+        self.index = {obj.as_pointer(): idx for idx, obj in enumerate(objects)}
+        self.flags = [bitflag] * len(objects)
+        self.filter_type = filter_type
+        self.link_type = link_type
+        self.search_depth = search_depth
+        self.bitflag = bitflag
+        self.material_users = None
+
+
+class _LightSourceScan:
+    """Emissive classification of one scene's objects, filled in time slices after load.
+
+    ``index`` and ``material_users`` mirror ``_FilterListEntry`` so material edits only
+    drop the results of objects using the changed materials.
+    """
+    __slots__ = ("scene_pointer", "objects", "index", "search_depth", "emissive", "position", "material_users")
+
+    def __init__(self, scene, search_depth):
+        self.scene_pointer = scene.as_pointer()
+        self.objects = scene.objects[:]
+        self.index = {obj.as_pointer(): idx for idx, obj in enumerate(self.objects)}
+        self.search_depth = search_depth
+        self.emissive = {}
+        self.position = 0
+        self.material_users = None
+
+    @property
+    def running(self) -> bool:
+        return self.position < len(self.objects)
 
 
 def invalidate_filter_cache():
-    global _filter_cache_generation
+    global _filter_cache_generation, _light_source_scan
     _filter_list_cache.clear()
     _filtered_objects_cache.clear()
     _filter_visibility_state_cache.clear()
+    if _light_source_scan is not None and not _light_source_scan.running:
+        # Finished results are only trusted until the first cache rebuild consumes them.
+        _light_source_scan = None
     _filter_cache_generation += 1
 
 
@@ -30,9 +90,49 @@ def _filter_cache_key(context, bitflag, pref):
     )
 
 
-def filter_list(context, bitflag=None):
+def _is_emissive(obj, context, entry, emission_cache, partial):
+    scan = _light_source_scan
+    if (
+            scan is not None
+            and scan.scene_pointer == entry.scene_pointer
+            and scan.search_depth == entry.search_depth
+    ):
+        emissive = scan.emissive.get(obj.as_pointer())
+        if emissive is not None:
+            return emissive
+        if partial and scan.running:
+            return False
+    from .utils import is_emissive_light_source
+    return is_emissive_light_source(
+        obj, context, search_depth=entry.search_depth, cache=emission_cache)
+
+
+def _object_flag(obj, context, entry, emission_cache, partial=False):
+    from .utils import check_link
+
+    bitflag = entry.bitflag
+    filter_type = entry.filter_type
+    if filter_type == "ALL":
+        is_show = obj.type == "LIGHT" or _is_emissive(obj, context, entry, emission_cache, partial)
+        flag = bitflag if is_show else EMPTY
+    elif filter_type == "LIGHT":
+        flag = bitflag if obj.type == 'LIGHT' else EMPTY
+    elif filter_type == "EMISSION":
+        flag = bitflag if _is_emissive(obj, context, entry, emission_cache, partial) else EMPTY
+    else:
+        flag = EMPTY
+
+    link_type = entry.link_type
+    if flag == bitflag and link_type != "ALL":
+        is_link = check_link(obj)
+        is_ok = (link_type == "LINK" and is_link) or (link_type == "NOT_LINK" and not is_link)
+        flag = bitflag if is_ok else EMPTY
+    return flag
+
+
+def _filter_list_entry(context, bitflag, partial=False):
     from .handlers import ensure_filter_cache_invalidation_handler
-    from .utils import check_link, get_pref, is_emissive_light_source
+    from .utils import get_pref
 
     ensure_filter_cache_invalidation_handler()
     pref = get_pref(context)
@@ -47,74 +147,699 @@ def filter_list(context, bitflag=None):
         # Keep the stored Cycles preference intact, but present a useful
         # native-light list while the unsupported filter UI is hidden.
         filter_type = "LIGHT"
-    link_type = pref.light_link_filter_type
-    search_deep = pref.node_search_depth
 
-    objects = context.scene.objects[:]
-    flt_flags = [bitflag] * len(objects)
+    entry = _FilterListEntry(
+        context.scene.as_pointer(),
+        context.scene.objects[:],
+        filter_type,
+        pref.light_link_filter_type,
+        pref.node_search_depth,
+        bitflag,
+    )
+    partial = partial and filter_type != "LIGHT" and is_light_source_scan_running(context)
     emission_cache = {}
+    flt_flags = entry.flags
+    for idx, obj in enumerate(entry.objects):
+        flt_flags[idx] = _object_flag(obj, context, entry, emission_cache, partial)
 
-    for idx, obj in enumerate(objects):
-        if filter_type == "ALL":
-            is_show = obj.type == "LIGHT" or is_emissive_light_source(
-                obj, context, search_depth=search_deep, cache=emission_cache)
-            flag = bitflag if is_show else EMPTY
-        elif filter_type == "LIGHT":
-            flag = bitflag if obj.type == 'LIGHT' else EMPTY
-        elif filter_type == "EMISSION":
-            flag = bitflag if is_emissive_light_source(
-                obj, context, search_depth=search_deep, cache=emission_cache) else EMPTY
-        else:
-            flag = EMPTY
+    if not partial:
+        _filter_list_cache[cache_key] = entry
+    return entry
 
-        if flag == bitflag and link_type != "ALL":
-            is_link = check_link(obj)
-            is_ok = (link_type == "LINK" and is_link) or (link_type == "NOT_LINK" and not is_link)
-            flag = bitflag if is_ok else EMPTY
-        flt_flags[idx] = flag
 
-    if len(_filter_list_cache) > 16:
-        _filter_list_cache.clear()
-    _filter_list_cache[cache_key] = flt_flags
-    return flt_flags
+def _flagged_objects(entry):
+    return tuple(obj for obj, flag in zip(entry.objects, entry.flags) if flag)
+
 
+def filter_objects(context, partial=False):
+    """Objects that pass the list filter.
 
-def filter_objects(context):
+    With ``partial``, a running light-source scan is not forced to finish: objects it
+    has not classified yet are left out and the result is not cached.
+    """
     from .utils import get_pref
 
-    key = (_filter_cache_key(context, True, get_pref(context)), _filter_cache_generation)
+    if partial and is_light_source_scan_running(context):
+        return _flagged_objects(_filter_list_entry(context, True, partial=True))
+    key = _filter_cache_key(context, True, get_pref(context))
     cached = _filtered_objects_cache.get(key)
     if cached is not None:
         return cached
-    objects = tuple(
-        context.scene.objects[i]
-        for i, flag in enumerate(filter_list(context, bitflag=True))
-        if flag
-    )
-    if len(_filtered_objects_cache) > 16:
-        _filtered_objects_cache.clear()
+    objects = _flagged_objects(_filter_list_entry(context, True))
     _filtered_objects_cache[key] = objects
     return objects
 
 
-def get_filter_visibility_state(context):
-    from .utils import get_pref
-
-    key = (_filter_cache_key(context, True, get_pref(context)), _filter_cache_generation)
-    cached = _filter_visibility_state_cache.get(key)
-    if cached is not None:
-        return cached
+def _filter_visibility_state(objects):
     last_show = None
-    for obj in filter_objects(context):
+    for obj in objects:
         show = obj.light_helper_property.show_in_view
         if last_show is None:
             last_show = show
         elif show != last_show:
-            result = ('REMOVE', show)
-            break
-    else:
-        result = ('HIDE_OFF', True) if last_show is True else ('HIDE_ON', False)
-    if len(_filter_visibility_state_cache) > 16:
-        _filter_visibility_state_cache.clear()
+            return 'REMOVE', show
+    return ('HIDE_OFF', True) if last_show is True else ('HIDE_ON', False)
+
+
+def get_filter_visibility_state(context, partial=False):
+    """Icon and target state for the filtered visibility toggle; see ``filter_objects``."""
+    from .utils import get_pref
+
+    if partial and is_light_source_scan_running(context):
+        return _filter_visibility_state(filter_objects(context, partial=True))
+    key = _filter_cache_key(context, True, get_pref(context))
+    cached = _filter_visibility_state_cache.get(key)
+    if cached is not None:
+        return cached
+    result = _filter_visibility_state(filter_objects(context))
     _filter_visibility_state_cache[key] = result
     return result
+
+
+def is_light_source_scan_running(context) -> bool:
+    scan = _light_source_scan
+    return scan is not None and scan.running and scan.scene_pointer == context.scene.as_pointer()
+
+
+def get_light_source_scan_progress(context) -> float | None:
+    """Fraction of scene objects classified by the background scan, or None when idle."""
+    if not is_light_source_scan_running(context):
+        return None
+    scan = _light_source_scan
+    return scan.position / len(scan.objects)
+
+
+def schedule_light_source_scan() -> None:
+    """Classify the current scene's objects in time slices instead of on the first list draw."""
+    global _light_source_scan
+    _light_source_scan = None
+    if not bpy.app.timers.is_registered(_light_source_scan_tick):
+        bpy.app.timers.register(_light_source_scan_tick, first_interval=0.0)
+
+
+def cancel_light_source_scan() -> None:
+    global _light_source_scan
+    _light_source_scan = None
+    if bpy.app.timers.is_registered(_light_source_scan_tick):
+        bpy.app.timers.unregister(_light_source_scan_tick)
+
+
+def _light_source_scan_tick():
+    global _filter_cache_generation, _light_source_scan
+    from .handlers import ensure_filter_cache_invalidation_handler
+    from .utils import get_pref, is_emissive_light_source
+    from .utils.overlay import tag_view3d_redraw
+
+    try:
+        context = bpy.context
+        scene = context.scene
+        if scene is None:
+            _light_source_scan = None
+            return None
+        # Scan in every engine: the light-source registry is built from these results.
+        search_depth = get_pref(context).node_search_depth
+        scan = _light_source_scan
+        if (
+                scan is None
+                or scan.scene_pointer != scene.as_pointer()
+                or scan.search_depth != search_depth
+                or len(scan.objects) != len(scene.objects)
+        ):
+            scan = _light_source_scan = _LightSourceScan(scene, search_depth)
+        # Keep depsgraph deltas flowing into the scan while it runs.
+        ensure_filter_cache_invalidation_handler()
+
+        objects = scan.objects
+        start = scan.position
+        deadline = time.perf_counter() + _LIGHT_SOURCE_SCAN_SLICE_SECONDS
+        while scan.position < len(objects):
+            obj = objects[scan.position]
+            scan.position += 1
+            if obj.type != 'LIGHT':
+                scan.emissive[obj.as_pointer()] = is_emissive_light_source(
+                    obj, search_depth=scan.search_depth)
+            if time.perf_counter() >= deadline:
+                break
+        registry_changed = _add_scan_slice_to_registry(scene, scan, objects[start:scan.position])
+    except ReferenceError:
+        # An object was removed mid-slice; start over with the current scene.
+        _light_source_scan = None
+        return _LIGHT_SOURCE_SCAN_INTERVAL
+    except AttributeError:
+        _light_source_scan = None
+        return None
+
+    if registry_changed:
+        _filter_cache_generation += 1
+    # Redraw for the progress bar even when no listed source changed.
+    tag_view3d_redraw(context)
+    return _LIGHT_SOURCE_SCAN_INTERVAL if scan.running else None
+
+
+def _discard_light_source_scan_results(changed_objects, changed_materials):
+    """Forget scan results that the changes may have flipped; the scan keeps its position."""
+    scan = _light_source_scan
+    emissive = scan.emissive
+    for pointer in changed_objects:
+        emissive.pop(pointer, None)
+        idx = scan.index.get(pointer)
+        if idx is not None:
+            _refresh_material_users(scan, idx)
+    if changed_materials and emissive:
+        users = _entry_material_users(scan)
+        objects = scan.objects
+        for pointer in changed_materials:
+            for idx in users.get(pointer, ()):
+                emissive.pop(objects[idx].as_pointer(), None)
+
+
+class _ShaderTreeIndex:
+    """Group nodes per shader tree, inverted so a changed group finds every tree nesting it."""
+    __slots__ = ("children", "parents", "tree_materials", "group_count", "material_count")
+
+    def __init__(self):
+        self.children = {}
+        self.parents = {}
+        self.tree_materials = {}
+        self.group_count = 0
+        self.material_count = 0
+
+
+_shader_tree_index = None
+
+
+def reset_shader_tree_index() -> None:
+    global _shader_tree_index
+    _shader_tree_index = None
+
+
+def _index_shader_tree(index, pointer, tree) -> None:
+    children = frozenset(
+        node.node_tree.as_pointer()
+        for node in tree.nodes
+        if node.type == 'GROUP' and node.node_tree is not None
+    )
+    previous = index.children.get(pointer, frozenset())
+    if children == previous:
+        return
+    for child in previous - children:
+        parents = index.parents.get(child)
+        if parents is not None:
+            parents.discard(pointer)
+    for child in children - previous:
+        index.parents.setdefault(child, set()).add(pointer)
+    index.children[pointer] = children
+
+
+def _ensure_shader_tree_index():
+    global _shader_tree_index
+    node_groups = bpy.data.node_groups
+    materials = bpy.data.materials
+    index = _shader_tree_index
+    if (
+            index is not None
+            and index.group_count == len(node_groups)
+            and index.material_count == len(materials)
+    ):
+        return index
+    index = _ShaderTreeIndex()
+    for group in node_groups:
+        if group.type == 'SHADER':
+            _index_shader_tree(index, group.as_pointer(), group)
+    for material in materials:
+        node_tree = material.node_tree
+        if node_tree is not None:
+            pointer = node_tree.as_pointer()
+            index.tree_materials[pointer] = material.as_pointer()
+            _index_shader_tree(index, pointer, node_tree)
+    index.group_count = len(node_groups)
+    index.material_count = len(materials)
+    _shader_tree_index = index
+    return index
+
+
+def affected_shader_tree_pointers(summary) -> set[int]:
+    """Shader trees whose output may have changed, including every tree nesting a changed group."""
+    affected = summary.memo.get("shader_trees")
+    if affected is not None:
+        return affected
+    index = _ensure_shader_tree_index()
+    affected = set()
+    for material in summary.materials.values():
+        node_tree = material.node_tree
+        if node_tree is not None:
+            pointer = node_tree.as_pointer()
+            index.tree_materials[pointer] = material.as_pointer()
+            _index_shader_tree(index, pointer, node_tree)
+            affected.add(pointer)
+    stack = []
+    for pointer, tree in summary.shader_trees.items():
+        _index_shader_tree(index, pointer, tree)
+        stack.append(pointer)
+    while stack:
+        pointer = stack.pop()
+        if pointer in affected:
+            continue
+        affected.add(pointer)
+        stack.extend(index.parents.get(pointer, ()))
+    summary.memo["shader_trees"] = affected
+    return affected
+
+
+def _object_material_pointers(obj) -> set[int]:
+    return {
+        slot.material.as_pointer()
+        for slot in obj.material_slots
+        if slot.material is not None
+    }
+
+
+def _entry_material_users(entry):
+    if entry.material_users is None:
+        users = {}
+        for idx, obj in enumerate(entry.objects):
+            for pointer in _object_material_pointers(obj):
+                users.setdefault(pointer, set()).add(idx)
+        entry.material_users = users
+    return entry.material_users
+
+
+def _refresh_material_users(entry, idx):
+    if entry.material_users is None:
+        return
+    for users in entry.material_users.values():
+        users.discard(idx)
+    for pointer in _object_material_pointers(entry.objects[idx]):
+        entry.material_users.setdefault(pointer, set()).add(idx)
+
+
+def _collect_filter_changes(summary):
+    changes = summary.memo.get("filter_changes")
+    if changes is None:
+        tree_materials = _ensure_shader_tree_index().tree_materials
+        changed_materials = set(summary.materials)
+        for pointer in affected_shader_tree_pointers(summary):
+            material = tree_materials.get(pointer)
+            if material is not None:
+                changed_materials.add(material)
+        changes = summary.memo["filter_changes"] = (summary.changed_objects(), changed_materials)
+    return changes
+
+
+def update_filter_cache_from_summary(scene, summary) -> bool:
+    """Patch cached list flags for the objects and materials changed in a depsgraph update.
+
+    Returns False when objects were added to or removed from ``scene``; the caller
+    then has to fall back to ``invalidate_filter_cache``.
+    """
+    global _filter_cache_generation
+    if not _filter_list_cache and _light_source_scan is None:
+        _filter_cache_generation += 1
+        return True
+    try:
+        changed_objects, changed_materials = _collect_filter_changes(summary)
+        if _light_source_scan is not None:
+            _discard_light_source_scan_results(changed_objects, changed_materials)
+        scene_pointer = scene.as_pointer()
+        scene_objects = scene.objects
+        scene_object_count = len(scene_objects)
+        emission_cache = {}
+        for key, entry in list(_filter_list_cache.items()):
+            if entry.scene_pointer != scene_pointer:
+                # Only the evaluated scene reports deltas; other scenes rebuild on demand.
+                _filter_list_cache.pop(key, None)
+                _filtered_objects_cache.pop(key, None)
+                _filter_visibility_state_cache.pop(key, None)
+                continue
+            if scene_object_count != len(entry.objects):
+                return False
+            dirty = set()
+            for pointer, obj in changed_objects.items():
+                idx = entry.index.get(pointer)
+                if idx is None:
+                    if scene_objects.get(obj.name) == obj:
+                        return False
+                    continue
+                dirty.add(idx)
+                _refresh_material_users(entry, idx)
+            if changed_materials and entry.filter_type != "LIGHT":
+                users = _entry_material_users(entry)
+                for pointer in changed_materials:
+                    dirty.update(users.get(pointer, ()))
+            flags_changed = False
+            for idx in dirty:
+                flag = _object_flag(entry.objects[idx], None, entry, emission_cache)
+                if flag != entry.flags[idx]:
+                    entry.flags[idx] = flag
+                    flags_changed = True
+            if flags_changed and key in _filtered_objects_cache:
+                _filtered_objects_cache[key] = _flagged_objects(entry)
+            if dirty:
+                _filter_visibility_state_cache.pop(key, None)
+    except ReferenceError:
+        return False
+    _filter_cache_generation += 1
+    return True
+
+
+class _LightSourceRegistry:
+    """Bookkeeping behind one scene's ``light_sources`` collection.
+
+    ``object_pointers`` mirrors ``scene.objects`` so added and removed objects can be
+    found without reclassifying the scene; ``material_emission`` remembers each
+    material's emission result so a changed material only reclassifies its users.
+    ``scanned`` turns True once a background scan has covered every object.
+    """
+    __slots__ = (
+        "scene_pointer",
+        "search_depth",
+        "object_pointers",
+        "sources",
+        "material_emission",
+        "scanned",
+    )
+
+    def __init__(self, scene, search_depth):
+        self.scene_pointer = scene.as_pointer()
+        self.search_depth = search_depth
+        self.object_pointers = set()
+        self.sources = set()
+        self.material_emission = {}
+        self.scanned = False
+
+
+_light_source_registry = None
+_registry_pending_objects = {}
+_registry_pending_materials = set()
+
+
+def _material_has_emission(material, registry) -> bool:
+    from .utils import node_tree_has_emission
+
+    pointer = material.as_pointer()
+    emissive = registry.material_emission.get(pointer)
+    if emissive is None:
+        emissive = bool(
+            material.use_nodes
+            and material.node_tree is not None
+            and node_tree_has_emission(material.node_tree, registry.search_depth)
+        )
+        registry.material_emission[pointer] = emissive
+    return emissive
+
+
+def _classify_light_source(obj, registry) -> bool:
+    if obj.type == 'LIGHT':
+        return True
+    if not hasattr(obj, "light_linking"):
+        return False
+    return any(
+        _material_has_emission(slot.material, registry)
+        for slot in obj.material_slots
+        if slot.material is not None
+    )
+
+
+def _remove_registry_items(items, registry, pointers) -> None:
+    for index in range(len(items) - 1, -1, -1):
+        obj = items[index].object
+        if obj is None or obj.as_pointer() in pointers:
+            items.remove(index)
+    registry.sources.difference_update(pointers)
+
+
+def _apply_scan_results(registry, items, objects, emissive) -> bool:
+    """Add or drop scanned objects whose listing disagrees with the scan; True on any change."""
+    removed = set()
+    added = False
+    for obj in objects:
+        pointer = obj.as_pointer()
+        # Lights are never scanned, and results dropped by an edit arrive as deltas instead.
+        is_source = emissive.get(pointer)
+        if is_source is None or pointer not in registry.object_pointers:
+            continue
+        if is_source and pointer not in registry.sources:
+            items.add().object = obj
+            registry.sources.add(pointer)
+            added = True
+        elif not is_source and pointer in registry.sources:
+            removed.add(pointer)
+    if removed:
+        _remove_registry_items(items, registry, removed)
+    return added or bool(removed)
+
+
+def _add_scan_slice_to_registry(scene, scan, objects) -> bool:
+    registry = _light_source_registry
+    if (
+            registry is None
+            or registry.scene_pointer != scan.scene_pointer
+            or registry.search_depth != scan.search_depth
+    ):
+        return False
+    changed = _apply_scan_results(
+        registry, scene.light_helper_property.light_sources, objects, scan.emissive)
+    if not scan.running:
+        registry.scanned = True
+    return changed
+
+
+def _start_light_source_registry(scene, search_depth) -> None:
+    """Adopt the saved items and list native lights now; scan slices add the rest."""
+    global _light_source_registry
+    from .migration import migrate_active_object_index
+
+    registry = _LightSourceRegistry(scene, search_depth)
+    migrate_active_object_index(scene, lambda obj: _classify_light_source(obj, registry))
+    registry.object_pointers = {obj.as_pointer() for obj in scene.objects}
+    items = scene.light_helper_property.light_sources
+    stale = set()
+    has_empty = False
+    for item in items:
+        obj = item.object
+        if obj is None:
+            has_empty = True
+            continue
+        pointer = obj.as_pointer()
+        if pointer in registry.object_pointers:
+            registry.sources.add(pointer)
+        else:
+            stale.add(pointer)
+    if stale or has_empty:
+        _remove_registry_items(items, registry, stale)
+    for obj in scene.objects:
+        pointer = obj.as_pointer()
+        if obj.type == 'LIGHT' and pointer not in registry.sources:
+            items.add().object = obj
+            registry.sources.add(pointer)
+    _light_source_registry = registry
+
+    scan = _light_source_scan
+    if (
+            scan is not None
+            and scan.scene_pointer == registry.scene_pointer
+            and scan.search_depth == search_depth
+    ):
+        # A scan started on file load may already be part way through.
+        _apply_scan_results(registry, items, scan.objects[:scan.position], scan.emissive)
+        registry.scanned = not scan.running and len(scan.objects) == len(registry.object_pointers)
+
+
+def _apply_light_source_registry_deltas(scene, registry) -> None:
+    """Fold queued depsgraph changes into the registry."""
+    pending = dict(_registry_pending_objects)
+    if _registry_pending_materials:
+        changed = set()
+        for material in bpy.data.materials:
+            pointer = material.as_pointer()
+            if pointer not in _registry_pending_materials:
+                continue
+            previous = registry.material_emission.pop(pointer, None)
+            if previous is None or _material_has_emission(material, registry) != previous:
+                changed.add(pointer)
+        if changed:
+            # Users of the material are not indexed; find them by their slots.
+            for obj in scene.objects:
+                if not changed.isdisjoint(_object_material_pointers(obj)):
+                    pending[obj.as_pointer()] = obj
+
+    items = scene.light_helper_property.light_sources
+    scene_objects = scene.objects
+    if len(scene_objects) != len(registry.object_pointers):
+        current = {obj.as_pointer(): obj for obj in scene_objects}
+        for pointer, obj in current.items():
+            if pointer not in registry.object_pointers:
+                pending[pointer] = obj
+        removed = registry.object_pointers.difference(current)
+        registry.object_pointers = set(current)
+        _remove_registry_items(items, registry, removed)
+    elif any(item.object is None for item in items):
+        _remove_registry_items(items, registry, ())
+
+    for pointer, obj in pending.items():
+        try:
+            in_scene = scene_objects.get(obj.name) == obj
+        except ReferenceError:
+            continue
+        is_source = in_scene and _classify_light_source(obj, registry)
+        if is_source and pointer not in registry.sources:
+            items.add().object = obj
+            registry.sources.add(pointer)
+        elif not is_source and pointer in registry.sources:
+            _remove_registry_items(items, registry, {pointer})
+
+
+def _light_source_registry_tick():
+    global _filter_cache_generation, _light_source_registry
+    from .utils import get_pref
+    from .utils.overlay import tag_view3d_redraw
+
+    try:
+        context = bpy.context
+        scene = context.scene
+        if scene is None:
+            return None
+        search_depth = get_pref(context).node_search_depth
+        registry = _light_source_registry
+        if (
+                registry is None
+                or registry.scene_pointer != scene.as_pointer()
+                or registry.search_depth != search_depth
+        ):
+            _start_light_source_registry(scene, search_depth)
+        else:
+            _apply_light_source_registry_deltas(scene, registry)
+        if not _light_source_registry.scanned and not bpy.app.timers.is_registered(_light_source_scan_tick):
+            schedule_light_source_scan()
+    except (AttributeError, ReferenceError):
+        _light_source_registry = None
+    finally:
+        _registry_pending_objects.clear()
+        _registry_pending_materials.clear()
+    _filter_cache_generation += 1
+    tag_view3d_redraw(bpy.context)
+    return None
+
+
+def _schedule_light_source_registry_update() -> None:
+    if not bpy.app.timers.is_registered(_light_source_registry_tick):
+        bpy.app.timers.register(_light_source_registry_tick, first_interval=0.0)
+
+
+def ensure_light_source_registry(context) -> None:
+    """Start maintaining ``scene.light_helper_property.light_sources`` for the drawn scene."""
+    from .handlers import light_source_registry_handler, subscribe_depsgraph
+    from .utils import get_pref
+
+    subscribe_depsgraph(light_source_registry_handler)
+    registry = _light_source_registry
+    if (
+            registry is None
+            or registry.scene_pointer != context.scene.as_pointer()
+            or registry.search_depth != get_pref(context).node_search_depth
+            or (not registry.scanned and not bpy.app.timers.is_registered(_light_source_scan_tick))
+    ):
+        # ID data cannot be written while drawing, so update from a timer.
+        _schedule_light_source_registry_update()
+
+
+def queue_light_source_registry_changes(scene, summary) -> None:
+    registry = _light_source_registry
+    if registry is None or registry.scene_pointer != scene.as_pointer():
+        return
+    changed_objects, changed_materials = _collect_filter_changes(summary)
+    _registry_pending_objects.update(changed_objects)
+    _registry_pending_materials.update(changed_materials)
+    if (
+            _registry_pending_objects
+            or _registry_pending_materials
+            or len(scene.objects) != len(registry.object_pointers)
+    ):
+        _schedule_light_source_registry_update()
+
+
+def reset_light_source_registry() -> None:
+    """Forget module-side registry state after file load or unregister."""
+    global _light_source_registry
+    _light_source_registry = None
+    _registry_pending_objects.clear()
+    _registry_pending_materials.clear()
+    if bpy.app.timers.is_registered(_light_source_registry_tick):
+        bpy.app.timers.unregister(_light_source_registry_tick)
+
+
+def reconcile_light_source_registry(scene) -> None:
+    """Adopt the ``light_sources`` items restored by undo or redo.
+
+    The saved items already describe the restored scene, so only lights missing
+    from them and the non-light items themselves are reclassified.
+    """
+    global _light_source_registry, _light_source_scan
+    registry = _light_source_registry
+    if _light_source_scan is not None:
+        # Scanned objects may not survive the undo step.
+        if _light_source_scan.running:
+            schedule_light_source_scan()
+        else:
+            _light_source_scan = None
+    reset_light_source_registry()
+    if (
+            scene is None
+            or registry is None
+            or registry.scene_pointer != scene.as_pointer()
+    ):
+        return
+    restored = _LightSourceRegistry(scene, registry.search_depth)
+    restored.scanned = registry.scanned
+    restored.object_pointers = {obj.as_pointer() for obj in scene.objects}
+    for item in scene.light_helper_property.light_sources:
+        obj = item.object
+        if obj is None:
+            continue
+        pointer = obj.as_pointer()
+        restored.sources.add(pointer)
+        if obj.type != 'LIGHT' or pointer not in restored.object_pointers:
+            _registry_pending_objects[pointer] = obj
+    for obj in scene.objects:
+        if obj.type == 'LIGHT' and obj.as_pointer() not in restored.sources:
+            _registry_pending_objects[obj.as_pointer()] = obj
+    _light_source_registry = restored
+    _schedule_light_source_registry_update()
+
+
+def light_source_registry_index(scene, obj) -> int:
+    """Index of ``obj`` in the scene's light-source registry, or -1."""
+    for index, item in enumerate(scene.light_helper_property.light_sources):
+        if item.object == obj:
+            return index
+    return -1
+
+
+def filter_light_sources(context, objects, bitflag):
+    """List flags for registry objects; the registry already holds only light sources."""
+    from .utils import check_link, get_pref
+
+    pref = get_pref(context)
+    filter_type = pref.light_list_filter_type
+    if context.scene.render.engine != "CYCLES":
+        filter_type = "LIGHT"
+    link_type = pref.light_link_filter_type
+    flags = []
+    for obj in objects:
+        if obj is None:
+            flags.append(EMPTY)
+            continue
+        is_light = obj.type == 'LIGHT'
+        if filter_type == "ALL":
+            show = True
+        elif filter_type == "LIGHT":
+            show = is_light
+        elif filter_type == "EMISSION":
+            show = not is_light
+        else:
+            show = False
+        if show and link_type != "ALL":
+            is_link = check_link(obj)
+            show = (link_type == "LINK" and is_link) or (link_type == "NOT_LINK" and not is_link)
+        flags.append(bitflag if show else EMPTY)
+    return flags
@@ -1,17 +1,149 @@
 import time
+import traceback
 
 import bpy
 
 from .utils import (
     ILLUMINATED_OBJECT_TYPE_LIST,
     has_shared_linking_collections,
+    linking_batch,
     make_light_linking_single_user,
-    process_duplicated_object,
+    process_duplicated_objects,
+    update_linking_collection_owners,
 )
 
 _processing = False
+_AUTO_FIX_DEFAULT_DELAY = 0.3
+_auto_fix_queue = {}
+_auto_fix_last_update = 0.0
 _FILTER_CACHE_HANDLER_IDLE_SECONDS = 1.0
 _filter_cache_last_used = 0.0
+_depsgraph_subscribers = []
+_dispatch_stats = {"calls": 0, "total": 0.0, "last": 0.0, "max": 0.0, "subscribers": {}}
+
+
+class DepsgraphSummary:
+    """One pass over ``depsgraph.updates``, resolved to original IDs and shared by every subscriber.
+
+    Object updates are keyed by pointer and split into transform, geometry and shading sets;
+    collections, light data, materials and shader node trees are keyed by pointer as well.
+    Geometry Nodes and compositor trees cannot affect emission, so they are not recorded.
+    ``memo`` holds results subscribers derive from the summary, so each is computed once.
+    """
+    __slots__ = (
+        "objects",
+        "transformed",
+        "geometry",
+        "shading",
+        "collections",
+        "lights",
+        "materials",
+        "shader_trees",
+        "scene_updated",
+        "memo",
+    )
+
+    def __init__(self, depsgraph: bpy.types.Depsgraph):
+        self.objects = {}
+        self.transformed = set()
+        self.geometry = set()
+        self.shading = set()
+        self.collections = {}
+        self.lights = {}
+        self.materials = {}
+        self.shader_trees = {}
+        self.scene_updated = False
+        self.memo = {}
+        for update in depsgraph.updates:
+            id_ref = update.id
+            if id_ref is None:
+                continue
+            if id_ref.is_evaluated:
+                id_ref = id_ref.original
+                if id_ref is None:
+                    continue
+            if isinstance(id_ref, bpy.types.Object):
+                pointer = id_ref.as_pointer()
+                self.objects[pointer] = id_ref
+                if update.is_updated_transform:
+                    self.transformed.add(pointer)
+                if update.is_updated_geometry:
+                    self.geometry.add(pointer)
+                if update.is_updated_shading:
+                    self.shading.add(pointer)
+            elif isinstance(id_ref, bpy.types.Collection):
+                self.collections[id_ref.as_pointer()] = id_ref
+            elif isinstance(id_ref, bpy.types.Light):
+                self.lights[id_ref.as_pointer()] = id_ref
+            elif isinstance(id_ref, bpy.types.Material):
+                self.materials[id_ref.as_pointer()] = id_ref
+            elif isinstance(id_ref, bpy.types.ShaderNodeTree):
+                self.shader_trees[id_ref.as_pointer()] = id_ref
+            elif isinstance(id_ref, bpy.types.Scene):
+                self.scene_updated = True
+
+    def is_transform_only(self, pointer: int) -> bool:
+        return pointer in self.transformed and pointer not in self.geometry and pointer not in self.shading
+
+    def changed_objects(self) -> dict:
+        """Updated objects, except those whose only change was their transform."""
+        return {
+            pointer: obj for pointer, obj in self.objects.items()
+            if not self.is_transform_only(pointer)
+        }
+
+
+@bpy.app.handlers.persistent
+def depsgraph_dispatch_handler(scene, depsgraph: bpy.types.Depsgraph):
+    """The add-on's only depsgraph_update_post handler; fans a shared summary out to subscribers."""
+    start = time.perf_counter()
+    summary = DepsgraphSummary(depsgraph)
+    subscriber_times = _dispatch_stats["subscribers"]
+    for callback in tuple(_depsgraph_subscribers):
+        callback_start = time.perf_counter()
+        try:
+            callback(scene, summary)
+        except Exception:
+            # Match Blender's handler behavior: report and keep running the others.
+            traceback.print_exc()
+        name = callback.__qualname__
+        subscriber_times[name] = subscriber_times.get(name, 0.0) + time.perf_counter() - callback_start
+    elapsed = time.perf_counter() - start
+    _dispatch_stats["calls"] += 1
+    _dispatch_stats["total"] += elapsed
+    _dispatch_stats["last"] = elapsed
+    _dispatch_stats["max"] = max(_dispatch_stats["max"], elapsed)
+
+
+def subscribe_depsgraph(callback) -> None:
+    """Call ``callback(scene, summary)`` after each depsgraph update until unsubscribed."""
+    if callback not in _depsgraph_subscribers:
+        _depsgraph_subscribers.append(callback)
+    if depsgraph_dispatch_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(depsgraph_dispatch_handler)
+
+
+def unsubscribe_depsgraph(callback) -> None:
+    if callback in _depsgraph_subscribers:
+        _depsgraph_subscribers.remove(callback)
+    if not _depsgraph_subscribers and depsgraph_dispatch_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(depsgraph_dispatch_handler)
+
+
+def is_depsgraph_subscribed(callback) -> bool:
+    return callback in _depsgraph_subscribers
+
+
+def get_depsgraph_dispatch_stats() -> dict:
+    """Call count and seconds spent in depsgraph handling, in total and per subscriber."""
+    stats = dict(_dispatch_stats)
+    stats["subscribers"] = dict(_dispatch_stats["subscribers"])
+    return stats
+
+
+def reset_depsgraph_dispatch_stats() -> None:
+    _dispatch_stats.update(calls=0, total=0.0, last=0.0, max=0.0)
+    _dispatch_stats["subscribers"].clear()
 
 
 def _auto_fix_enabled() -> bool:
@@ -22,111 +154,144 @@ def _auto_fix_enabled() -> bool:
         return False
 
 
-def _collect_candidate_objects(depsgraph: bpy.types.Depsgraph) -> list[bpy.types.Object]:
-    candidates = []
-    seen = set()
-    for update in depsgraph.updates:
-        id_ref = update.id
-        if not isinstance(id_ref, bpy.types.Object):
-            continue
-        if id_ref.is_evaluated:
-            id_ref = id_ref.original
-            if id_ref is None:
-                continue
-        if id_ref.name in seen:
-            continue
-        if id_ref.type not in ILLUMINATED_OBJECT_TYPE_LIST:
-            continue
-        seen.add(id_ref.name)
-        candidates.append(id_ref)
-    return candidates
+def _auto_fix_delay() -> float:
+    try:
+        from . import __package__ as base_package
+        return bpy.context.preferences.addons[base_package].preferences.auto_fix_delay
+    except (KeyError, AttributeError):
+        return _AUTO_FIX_DEFAULT_DELAY
 
 
-@bpy.app.handlers.persistent
-def depsgraph_update_post_handler(_scene, depsgraph: bpy.types.Depsgraph):
-    global _processing
+def depsgraph_update_post_handler(_scene, summary: DepsgraphSummary):
+    """Queue auto-fix candidates; the fix itself runs from a timer once updates settle."""
+    global _auto_fix_last_update
     if _processing or not _auto_fix_enabled():
         return
+    # Any update, including a grab's transform-only ones, pushes the drain back.
+    _auto_fix_last_update = time.monotonic()
+    for pointer, obj in summary.objects.items():
+        if summary.is_transform_only(pointer) or obj.type not in ILLUMINATED_OBJECT_TYPE_LIST:
+            continue
+        _auto_fix_queue[pointer] = obj
+    if _auto_fix_queue and not bpy.app.timers.is_registered(_drain_auto_fix_queue):
+        bpy.app.timers.register(_drain_auto_fix_queue, first_interval=_auto_fix_delay())
+
 
-    candidates = _collect_candidate_objects(depsgraph)
+def _drain_auto_fix_queue():
+    global _processing
+    remaining = _auto_fix_last_update + _auto_fix_delay() - time.monotonic()
+    if remaining > 0:
+        return remaining
+    if not _auto_fix_enabled():
+        _auto_fix_queue.clear()
+        return None
+
+    candidates = []
+    for obj in _auto_fix_queue.values():
+        try:
+            if obj.name in bpy.data.objects:
+                candidates.append(obj)
+        except ReferenceError:
+            continue
+    _auto_fix_queue.clear()
     if not candidates:
-        return
+        return None
 
     _processing = True
     try:
+        # Candidates may be fresh duplicates; record them before resolving shared collections.
+        update_linking_collection_owners(candidates)
         context = bpy.context
-        for obj in candidates:
-            if obj.type == 'LIGHT' and has_shared_linking_collections(obj):
-                make_light_linking_single_user(obj)
-                continue
-            process_duplicated_object(obj, context)
+        duplicates = []
+        with linking_batch(context):
+            for obj in candidates:
+                if obj.type == 'LIGHT' and has_shared_linking_collections(obj):
+                    make_light_linking_single_user(obj)
+                    continue
+                duplicates.append(obj)
+            # One pass for everything queued, e.g. a mass Shift+D.
+            process_duplicated_objects(duplicates, context)
     finally:
         _processing = False
+    return None
+
+
+def _clear_auto_fix_queue() -> None:
+    _auto_fix_queue.clear()
+    if bpy.app.timers.is_registered(_drain_auto_fix_queue):
+        bpy.app.timers.unregister(_drain_auto_fix_queue)
 
 
 def sync_auto_fix_depsgraph_handler(enabled: bool | None = None) -> None:
     if enabled is None:
         enabled = _auto_fix_enabled()
     if enabled:
-        if depsgraph_update_post_handler not in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post_handler)
-    elif depsgraph_update_post_handler in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post_handler)
+        subscribe_depsgraph(depsgraph_update_post_handler)
+    else:
+        unsubscribe_depsgraph(depsgraph_update_post_handler)
+        _clear_auto_fix_queue()
 
 
-@bpy.app.handlers.persistent
-def invalidate_filter_cache_handler(_scene, _depsgraph):
+def invalidate_filter_cache_handler(scene, summary: DepsgraphSummary):
+    from .filter import affected_shader_tree_pointers
+    from .utils import invalidate_collection_membership_cache, invalidate_emission_cache
     if time.monotonic() - _filter_cache_last_used > _FILTER_CACHE_HANDLER_IDLE_SECONDS:
         from .filter import invalidate_filter_cache
         from .utils import invalidate_linking_ui_cache
         invalidate_filter_cache()
         invalidate_linking_ui_cache()
-        if invalidate_filter_cache_handler in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.remove(invalidate_filter_cache_handler)
+        invalidate_collection_membership_cache()
+        invalidate_emission_cache()
+        unsubscribe_depsgraph(invalidate_filter_cache_handler)
         return
-    if not _depsgraph_updates_affect_ui_cache(_depsgraph):
+    invalidate_collection_membership_cache(summary.collections)
+    # Emission results must be current before the filter flags are patched below.
+    invalidate_emission_cache(affected_shader_tree_pointers(summary))
+    if not _summary_affects_ui_cache(summary):
         return
-    from .filter import invalidate_filter_cache
+    from .filter import invalidate_filter_cache, update_filter_cache_from_summary
     from .utils import invalidate_linking_ui_cache
-    invalidate_filter_cache()
+    # Patch cached list flags in place; only added or removed objects need a full rebuild.
+    if not update_filter_cache_from_summary(scene, summary):
+        invalidate_filter_cache()
     invalidate_linking_ui_cache()
 
 
-@bpy.app.handlers.persistent
-def world_environment_sun_sync_handler(scene, depsgraph):
+def world_environment_sun_sync_handler(scene, summary: DepsgraphSummary):
     """Keep newly added Sun lights from illuminating a managed environment dome."""
-    from .utils.world_environment import sync_world_environment_suns_from_depsgraph
-    sync_world_environment_suns_from_depsgraph(scene, depsgraph)
+    from .utils.world_environment import sync_world_environment_suns_from_summary
+    sync_world_environment_suns_from_summary(scene, summary)
+
+
+def linking_collection_owner_handler(_scene, summary: DepsgraphSummary):
+    """Keep the linking collection owner map current for added and edited objects."""
+    update_linking_collection_owners(summary.objects.values())
 
 
-def _depsgraph_updates_affect_ui_cache(depsgraph: bpy.types.Depsgraph) -> bool:
+def ensure_linking_collection_owner_handler() -> None:
+    if not is_depsgraph_subscribed(linking_collection_owner_handler):
+        subscribe_depsgraph(linking_collection_owner_handler)
+
+
+def light_source_registry_handler(scene, summary: DepsgraphSummary):
+    """Queue added, removed and re-shaded objects for the light-source registry."""
+    from .filter import queue_light_source_registry_changes
+    queue_light_source_registry_changes(scene, summary)
+
+
+def _summary_affects_ui_cache(summary: DepsgraphSummary) -> bool:
     """Ignore transform-only updates that cannot change linking or light-source lists."""
-    relevant_types = (
-        bpy.types.Collection,
-        bpy.types.Material,
-        bpy.types.NodeTree,
-    )
-    for update in depsgraph.updates:
-        id_ref = update.id
-        if isinstance(id_ref, bpy.types.Object):
-            transform_only = (
-                bool(getattr(update, "is_updated_transform", False))
-                and not bool(getattr(update, "is_updated_geometry", False))
-                and not bool(getattr(update, "is_updated_shading", False))
-            )
-            if not transform_only:
-                return True
-        elif isinstance(id_ref, relevant_types):
-            return True
-    return False
+    if summary.collections or summary.materials or summary.shader_trees:
+        return True
+    return any(not summary.is_transform_only(pointer) for pointer in summary.objects)
 
 
 def ensure_filter_cache_invalidation_handler() -> None:
     """Keep cache invalidation active only while a filtered list is being drawn."""
     global _filter_cache_last_used
     _filter_cache_last_used = time.monotonic()
-    if invalidate_filter_cache_handler not in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.append(invalidate_filter_cache_handler)
+    if not is_depsgraph_subscribed(invalidate_filter_cache_handler):
+        subscribe_depsgraph(invalidate_filter_cache_handler)
 
 
 def _scene_needs_world_environment_sun_sync(scene: bpy.types.Scene) -> bool:
@@ -152,10 +317,9 @@ def sync_world_environment_sun_handler(enabled: bool | None = None) -> None:
             for scene in scenes
         )
     if enabled:
-        if world_environment_sun_sync_handler not in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.append(world_environment_sun_sync_handler)
-    elif world_environment_sun_sync_handler in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(world_environment_sun_sync_handler)
+        subscribe_depsgraph(world_environment_sun_sync_handler)
+    else:
+        unsubscribe_depsgraph(world_environment_sun_sync_handler)
 
 
 def ensure_world_environment_sun_handler(scene: bpy.types.Scene) -> None:
@@ -164,16 +328,53 @@ def ensure_world_environment_sun_handler(scene: bpy.types.Scene) -> None:
         sync_world_environment_sun_handler(True)
 
 
+@bpy.app.handlers.persistent
+def light_helper_undo_post_handler(_scene) -> None:
+    """Drop pointer-keyed state that undo may have invalidated."""
+    from .filter import reconcile_light_source_registry, reset_shader_tree_index
+    from .utils import (
+        invalidate_collection_membership_cache,
+        invalidate_linking_collection_owners,
+        invalidate_safe_helper_index,
+    )
+    reconcile_light_source_registry(bpy.context.scene)
+    reset_shader_tree_index()
+    invalidate_collection_membership_cache()
+    invalidate_linking_collection_owners()
+    invalidate_safe_helper_index()
+    _clear_auto_fix_queue()
+
+
 @bpy.app.handlers.persistent
 def light_helper_load_post_handler(_filepath) -> None:
     """Refresh transient caches and handlers after Blender replaces file data."""
-    from .filter import invalidate_filter_cache
-    from .utils import invalidate_linking_ui_cache
+    from .filter import (
+        invalidate_filter_cache,
+        reset_light_source_registry,
+        reset_shader_tree_index,
+        schedule_light_source_scan,
+    )
+    from .utils import (
+        invalidate_collection_membership_cache,
+        invalidate_emission_cache,
+        invalidate_linking_collection_owners,
+        invalidate_linking_ui_cache,
+        invalidate_safe_helper_index,
+    )
     from .utils.world_environment import clear_world_environment_sync_state
     clear_world_environment_sync_state()
+    _clear_auto_fix_queue()
+    invalidate_linking_collection_owners()
+    invalidate_safe_helper_index()
     invalidate_filter_cache()
     invalidate_linking_ui_cache()
+    invalidate_collection_membership_cache()
+    invalidate_emission_cache()
+    reset_light_source_registry()
+    reset_shader_tree_index()
     sync_world_environment_sun_handler()
+    # Classify light sources in the background so the first sidebar draw stays responsive.
+    schedule_light_source_scan()
 
 
 def register():
@@ -181,6 +382,9 @@ def register():
     clear_world_environment_sync_state()
     if light_helper_load_post_handler not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(light_helper_load_post_handler)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if light_helper_undo_post_handler not in handlers:
+            handlers.append(light_helper_undo_post_handler)
     # Auto-fix is opt-in and never mutates data during registration or file load.
     sync_auto_fix_depsgraph_handler()
     # Manual enable can happen after a file containing a managed dome is open.
@@ -189,16 +393,40 @@ def register():
 
 def unregister():
     global _filter_cache_last_used
-    from .filter import invalidate_filter_cache
-    from .utils import invalidate_linking_ui_cache
+    from .filter import (
+        cancel_light_source_scan,
+        invalidate_filter_cache,
+        reset_light_source_registry,
+        reset_shader_tree_index,
+    )
+    from .utils import (
+        invalidate_collection_membership_cache,
+        invalidate_emission_cache,
+        invalidate_linking_collection_owners,
+        invalidate_linking_ui_cache,
+        invalidate_safe_helper_index,
+    )
     from .utils.world_environment import clear_world_environment_sync_state
     sync_auto_fix_depsgraph_handler(False)
     if light_helper_load_post_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(light_helper_load_post_handler)
-    if invalidate_filter_cache_handler in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(invalidate_filter_cache_handler)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if light_helper_undo_post_handler in handlers:
+            handlers.remove(light_helper_undo_post_handler)
+    unsubscribe_depsgraph(invalidate_filter_cache_handler)
     _filter_cache_last_used = 0.0
     sync_world_environment_sun_handler(False)
+    _depsgraph_subscribers.clear()
+    if depsgraph_dispatch_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(depsgraph_dispatch_handler)
+    reset_depsgraph_dispatch_stats()
+    cancel_light_source_scan()
+    reset_light_source_registry()
+    reset_shader_tree_index()
+    invalidate_linking_collection_owners()
+    invalidate_safe_helper_index()
     invalidate_filter_cache()
     invalidate_linking_ui_cache()
+    invalidate_collection_membership_cache()
+    invalidate_emission_cache()
     clear_world_environment_sync_state()
@@ -3,6 +3,7 @@ import bpy
 LIGHT_HELPER_SAFE_KEY = "light_helper_safe"
 LIGHT_HELPER_MANAGED_KEY = "light_helper_managed"
 LIGHT_HELPER_MIGRATED_KEY = "light_helper_migrated_v047"
+LIGHT_HELPER_LIGHT_SOURCES_KEY = "light_helper_light_sources_v1"
 
 
 def _is_legacy_safe_object(obj: bpy.types.Object) -> bool:
@@ -100,6 +101,29 @@ def migrate_scene(scene: bpy.types.Scene) -> bool:
     return True
 
 
+def migrate_active_object_index(scene: bpy.types.Scene, is_light_source) -> None:
+    """Re-point ``active_object_index`` from ``scene.objects`` to ``light_sources``.
+
+    Files saved before the light-source registry stored an index into
+    ``scene.objects``; ``is_light_source`` decides whether that object gets listed.
+    """
+    if scene.get(LIGHT_HELPER_LIGHT_SOURCES_KEY):
+        return
+    props = scene.light_helper_property
+    items = props.light_sources
+    if not len(items):
+        objects = scene.objects
+        index = props.active_object_index
+        obj = objects[index] if 0 <= index < len(objects) else None
+        new_index = -1
+        if obj is not None and is_light_source(obj):
+            items.add().object = obj
+            new_index = 0
+        # Set as an ID property so the update callback leaves the selection alone.
+        props["active_object_index"] = new_index
+    scene[LIGHT_HELPER_LIGHT_SOURCES_KEY] = True
+
+
 def run_legacy_cleanup() -> tuple[int, int]:
     """Remove legacy leftovers and migrate unmigrated scenes.
 
@@ -13,14 +13,15 @@ class LLP_OT_switch_filter_show(LightHelperOperator, bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         from ..filter import filter_objects
-        if not filter_objects(context):
+        # Polls run on every redraw; don't wait for a running light-source scan.
+        if not filter_objects(context, partial=True):
             cls.poll_message_set(p_("No filtered lights in the list"))
             return False
         return True
 
     def execute(self, context):
-        from ..filter import filter_objects, invalidate_filter_cache
-        _, show = self.get_icon(context)
+        from ..filter import filter_objects, get_filter_visibility_state, invalidate_filter_cache
+        _, show = get_filter_visibility_state(context)
         for obj in filter_objects(context):
             obj.light_helper_property.show_in_view = not show
         invalidate_filter_cache()
@@ -29,7 +30,7 @@ class LLP_OT_switch_filter_show(LightHelperOperator, bpy.types.Operator):
     @staticmethod
     def get_icon(context):
         from ..filter import get_filter_visibility_state
-        return get_filter_visibility_state(context)
+        return get_filter_visibility_state(context, partial=True)
 
 
 class LLP_OT_invert_filter_show(LightHelperOperator, bpy.types.Operator):
@@ -41,7 +42,8 @@ class LLP_OT_invert_filter_show(LightHelperOperator, bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         from ..filter import filter_objects
-        if not filter_objects(context):
+        # Polls run on every redraw; don't wait for a running light-source scan.
+        if not filter_objects(context, partial=True):
             cls.poll_message_set(p_("No filtered lights in the list"))
             return False
         return True
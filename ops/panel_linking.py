@@ -6,10 +6,12 @@ from ..utils import (
     init_light_linking,
     is_item_in_channel,
     is_linking_initialized,
-    link_item_both_channels,
     link_item_to_channel,
+    link_items_to_channels,
+    linking_batch,
     mark_managed_linking_collection,
     restore_light_linking,
+    update_linking_collection_owners,
 )
 from .common import LightHelperOperator, enum_coll_type, get_light_obj, operator_tooltip_description
 
@@ -56,12 +58,8 @@ class LLP_OT_remove_light_linking(LightHelperOperator, bpy.types.Operator):
             return {"CANCELLED"}
 
         if self.remove_all:
-            link_item_to_channel(
-                light, item, CollectionType.RECEIVER, False, context,
-                restore_default_when_empty=self.restore_default_when_empty,
-            )
-            link_item_to_channel(
-                light, item, CollectionType.BLOCKER, False, context,
+            link_items_to_channels(
+                light, [item], enabled=False, context=context,
                 restore_default_when_empty=self.restore_default_when_empty,
             )
         else:
@@ -161,6 +159,7 @@ class LLP_OT_add_light_linking(LightHelperOperator, bpy.types.Operator):
                     light.light_linking.receiver_collection = coll
                 else:
                     light.light_linking.blocker_collection = coll
+                update_linking_collection_owners((light,))
             link_item_to_channel(light, obj, coll_type, True, context)
 
         if self.index != -1:
@@ -239,10 +238,11 @@ class LLP_OT_link_selected_objs(LightHelperOperator, bpy.types.Operator):
         if not light:
             self.report({'ERROR'}, p_("No light selected"))
             return {"CANCELLED"}
-        for obj in context.selected_objects:
-            if obj == light or not is_linkable_object(obj):
-                continue
-            link_item_both_channels(light, obj, context)
+        link_items_to_channels(
+            light,
+            [obj for obj in context.selected_objects if obj != light and is_linkable_object(obj)],
+            context=context,
+        )
         return {"FINISHED"}
 
 
@@ -272,8 +272,9 @@ class LLP_OT_clear_selected_light_linking(LightHelperOperator, bpy.types.Operato
         if not lights:
             self.report({'WARNING'}, p_("No selected lights with light linking"))
             return {"CANCELLED"}
-        for light in lights:
-            restore_light_linking(light, context)
+        with linking_batch(context):
+            for light in lights:
+                restore_light_linking(light, context)
         self.report(
             {'INFO'},
             format_lights_report(
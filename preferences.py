@@ -94,6 +94,17 @@ class LLT_AddonPreferences(AddonPreferences):
         default=False,
         update=update_auto_fix_shared_linking,
     )
+    auto_fix_delay: FloatProperty(
+        name="Auto Fix Delay",
+        description="Seconds without scene changes to wait before fixing shared linking, so editing is never interrupted",
+        default=0.3,
+        min=0.0,
+        max=5.0,
+        step=10,
+        precision=2,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE',
+    )
     linking_tool_max_outlines: IntProperty(
         name="Linking Tool Max Outlines",
         description="Maximum number of linked targets to draw outlines for. Lines are always drawn",
@@ -149,6 +160,9 @@ class LLT_AddonPreferences(AddonPreferences):
         column.prop(self, "light_link_filter_type", text_ctxt="light_helper_zh_CN")
         column.prop(self, "moving_view_type", text_ctxt="light_helper_zh_CN")
         column.prop(self, "auto_fix_shared_linking")
+        row = column.row()
+        row.active = self.auto_fix_shared_linking
+        row.prop(self, "auto_fix_delay")
         column.prop(self, "linking_tool_max_outlines")
         column.separator()
         column.prop(self, "linking_tool_hud_scale")
@@ -103,6 +103,12 @@ class WorldSunLinkRecord(PropertyGroup):
     receiver_created: bpy.props.BoolProperty(default=False)
 
 
+class LightSourceItem(PropertyGroup):
+    # A real ID user: a deleted object stays in ``bpy.data`` until the registry next
+    # updates this scene and drops its item.
+    object: bpy.props.PointerProperty(type=bpy.types.Object)
+
+
 class SceneProperty(PropertyGroup):
     def update_pin_object(self, context):
         """Update pin object, effect the context layout object"""
@@ -324,10 +330,11 @@ class SceneProperty(PropertyGroup):
             return
         from .utils import is_in_view_layer, view_selected
         index = self.active_object_index
-        objects = context.scene.objects
-        if index < 0 or index >= len(objects):
+        if index < 0 or index >= len(self.light_sources):
+            return
+        act_obj = self.light_sources[index].object
+        if act_obj is None:
             return
-        act_obj = objects[index]
         if is_in_view_layer(context, act_obj):
             context.view_layer.objects.active = act_obj
             act_obj.select_set(True)
@@ -338,6 +345,10 @@ class SceneProperty(PropertyGroup):
         if is_session_active(context):
             sync_tool_subject_from_selection(context)
 
+    # Lights and emissive objects listed by LLT_UL_light, maintained by filter.py.
+    light_sources: bpy.props.CollectionProperty(type=LightSourceItem)
+    # Index into ``light_sources``; older files indexed ``scene.objects`` and are
+    # remapped by ``migration.migrate_active_object_index``.
     active_object_index: bpy.props.IntProperty(default=0, update=update_active_object_index)
 
     def update_active_linked_object_index(self, context):
@@ -545,8 +556,6 @@ class WindowManagerProperty(PropertyGroup):
         coll = wm.light_helper_property.light_linking_add_collection
         link_item_both_channels(obj, coll, context)
         wm.light_helper_property["light_linking_add_collection"] = None
-        from .utils.overlay import notify_linking_changed
-        notify_linking_changed(context)
 
     def update_add_obj(self, context):
         wm = context.window_manager
@@ -563,8 +572,6 @@ class WindowManagerProperty(PropertyGroup):
         obj2 = wm.light_helper_property.light_linking_add_object
         link_item_both_channels(obj, obj2, context)
         wm.light_helper_property["light_linking_add_object"] = None
-        from .utils.overlay import notify_linking_changed
-        notify_linking_changed(context)
 
     def update_add_light(self, context):
         wm = context.window_manager
@@ -585,8 +592,6 @@ class WindowManagerProperty(PropertyGroup):
         init_light_linking(light, context)
         link_item_both_channels(light, obj, context)
         wm.light_helper_property["object_linking_add_object"] = None
-        from .utils.overlay import notify_linking_changed
-        notify_linking_changed(context)
 
     def poll_object_linking_add_collection(self, coll: bpy.types.Collection):
         from .utils import get_all_light_effect_items_state, get_view_layer_collections_cache, is_managed_linking_collection
@@ -634,6 +639,7 @@ class WindowManagerProperty(PropertyGroup):
 property_list = [
     ObjectProperty,
     WorldSunLinkRecord,
+    LightSourceItem,
     SceneProperty,
     SoloVisibilityItem,
     WindowManagerProperty,
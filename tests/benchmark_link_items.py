@@ -0,0 +1,63 @@
+"""Per-item cost of linking N objects to a light, one item at a time versus in bulk.
+
+Run with Blender's ``bpy`` importable, e.g. ``python tests/benchmark_link_items.py``
+or ``blender -b --factory-startup --python tests/benchmark_link_items.py``.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+ADDON_DIR = Path(__file__).resolve().parent.parent
+SIZES = (100, 400, 1600)
+
+
+def _new_light(scene, name):
+    light = bpy.data.objects.new(name, bpy.data.lights.new(name, 'POINT'))
+    scene.collection.objects.link(light)
+    return light
+
+
+def _time(callback) -> float:
+    start = time.perf_counter()
+    callback()
+    return time.perf_counter() - start
+
+
+def main():
+    # Only importable once bpy is loaded.
+    import addon_utils
+
+    sys.path.insert(0, str(ADDON_DIR.parent))
+    addon = addon_utils.enable(ADDON_DIR.name, default_set=True, handle_error=None)
+    utils = addon.utils
+    coll_types = (utils.CollectionType.RECEIVER, utils.CollectionType.BLOCKER)
+    scene = bpy.context.scene
+    print(f"{'items':>6} {'single us/item':>15} {'bulk us/item':>13} {'speedup':>8}")
+    for size in SIZES:
+        items = []
+        for index in range(size):
+            obj = bpy.data.objects.new(f"Bench{size}_{index}", bpy.data.meshes.new(f"Bench{size}_{index}"))
+            scene.collection.objects.link(obj)
+            items.append(obj)
+        single = _new_light(scene, f"BenchSingle{size}")
+        bulk = _new_light(scene, f"BenchBulk{size}")
+        utils.init_light_linking(single)
+        utils.init_light_linking(bulk)
+
+        def link_single():
+            with utils.linking_batch():
+                for item in items:
+                    utils.link_item_both_channels(single, item)
+
+        single_time = _time(link_single)
+        bulk_time = _time(lambda: utils.link_items_to_channels(bulk, items, coll_types))
+        print(f"{size:>6} {single_time / size * 1e6:>15.1f} {bulk_time / size * 1e6:>13.1f} "
+              f"{single_time / bulk_time:>7.1f}x")
+    addon_utils.disable(ADDON_DIR.name)
+
+
+if __name__ == "__main__":
+    main()
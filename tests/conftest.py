@@ -0,0 +1,21 @@
+"""Enable the add-on from this checkout; needs Blender's ``bpy`` (Blender itself or the PyPI module)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ADDON_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def addon():
+    pytest.importorskip("bpy")
+    import addon_utils
+
+    if str(ADDON_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(ADDON_DIR.parent))
+    module = addon_utils.enable(ADDON_DIR.name, default_set=True, handle_error=None)
+    assert module is not None, "add-on failed to register"
+    yield module
+    addon_utils.disable(ADDON_DIR.name)
@@ -0,0 +1,57 @@
+"""Plain stand-ins for shader nodes, sockets and links; ``Node.inputs`` records each expansion."""
+
+
+class Socket:
+    def __init__(self, node=None, identifier="Value", default_value=None):
+        self.node = node
+        self.identifier = identifier
+        self.name = identifier
+        if default_value is not None:
+            self.default_value = default_value
+        self.links = []
+
+    @property
+    def is_linked(self):
+        return bool(self.links)
+
+    def link_from(self, node):
+        self.links.append(Link(node.outputs[0]))
+
+
+class Link:
+    def __init__(self, from_socket):
+        self.from_node = from_socket.node
+        self.from_socket = from_socket
+
+
+class Expansions(list):
+    """Nodes in the order their inputs were read; ``created`` lists every node built."""
+
+    def __init__(self):
+        super().__init__()
+        self.created = []
+
+
+class Node:
+    def __init__(self, node_type, expansions, input_count=0, default_value=None):
+        self.type = node_type
+        self.name = f"{node_type}.{len(expansions.created)}"
+        self.image = None
+        self.node_tree = None
+        self._inputs = [Socket(self, f"Input{index}") for index in range(input_count)]
+        self.outputs = [Socket(self, default_value=default_value)]
+        self._expansions = expansions
+        expansions.created.append(self)
+
+    @property
+    def inputs(self):
+        self._expansions.append(self)
+        return self._inputs
+
+    def as_pointer(self):
+        return id(self)
+
+
+class Tree:
+    def as_pointer(self):
+        return id(self)
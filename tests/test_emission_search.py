@@ -0,0 +1,81 @@
+"""``_node_search_emission`` on synthetic node graphs built from plain stub objects."""
+
+import pytest
+
+from node_stubs import Expansions, Node, Socket
+
+
+def _chain(length, tail_type="MIX"):
+    """Output <- ``length`` mix nodes <- one ``tail_type`` node."""
+    expansions = Expansions()
+    output = Node("OUTPUT_MATERIAL", expansions, 1)
+    node = output
+    for _ in range(length):
+        upstream = Node("MIX", expansions, 1)
+        node._inputs[0].link_from(upstream)
+        node = upstream
+    node._inputs[0].link_from(Node(tail_type, expansions))
+    return output, expansions
+
+
+def _lattice(layers, width, tail_type="MIX"):
+    """Every node links to every node of the next layer: ``width ** layers`` distinct paths."""
+    expansions = Expansions()
+    output = Node("OUTPUT_MATERIAL", expansions, width)
+    previous = [output]
+    for _ in range(layers):
+        layer = [Node("MIX", expansions, width) for _ in range(width)]
+        for node in previous:
+            for socket, upstream in zip(node._inputs, layer):
+                socket.link_from(upstream)
+        previous = layer
+    tail = Node(tail_type, expansions)
+    for node in previous:
+        node._inputs[0].link_from(tail)
+    return output, expansions
+
+
+@pytest.fixture
+def search(addon):
+    return addon.utils._node_search_emission
+
+
+@pytest.mark.parametrize("length", [10, 100, 1000])
+def test_deep_chain_expands_each_node_once(search, length):
+    output, expansions = _chain(length, "EMISSION")
+    assert search(output, length)
+    assert len(expansions) == length + 1
+
+
+def test_depth_limit_matches_path_length(search):
+    output, _ = _chain(20, "EMISSION")
+    # The emission node sits 21 links upstream: depth 20 still inspects it, 19 does not.
+    assert search(output, 20)
+    assert not search(output, 19)
+
+
+@pytest.mark.parametrize("layers, width", [(8, 4), (16, 4), (32, 4), (16, 8)])
+def test_wide_lattice_scales_with_node_count(search, layers, width):
+    output, expansions = _lattice(layers, width)
+    assert not search(output, layers + 1)
+    # Every node, output and tail included, is expanded once; a walk over every
+    # path would expand width ** layers nodes.
+    assert len(expansions) == layers * width + 2
+    assert len(set(map(id, expansions))) == len(expansions)
+
+
+def test_wide_lattice_finds_emission_at_the_bottom(search):
+    output, expansions = _lattice(24, 6, "EMISSION")
+    assert search(output, 24)
+    assert len(expansions) <= 24 * 6 + 1
+
+
+def test_principled_emission_strength(search):
+    expansions = Expansions()
+    output = Node("OUTPUT_MATERIAL", expansions, 1)
+    principled = Node("BSDF_PRINCIPLED", expansions)
+    principled._inputs = [Socket(principled, "Emission Strength", 0.0)]
+    output._inputs[0].link_from(principled)
+    assert not search(output, 5)
+    principled._inputs[0].default_value = 1.0
+    assert search(output, 5)
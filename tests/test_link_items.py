@@ -0,0 +1,124 @@
+"""``link_items_to_channels`` against one ``link_item_to_channel`` call per item and channel."""
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+@pytest.fixture
+def scene_items(addon):
+    scene = bpy.context.scene
+    created_objects = []
+    created_collections = []
+
+    def new_light(name):
+        light = bpy.data.objects.new(name, bpy.data.lights.new(name, 'POINT'))
+        scene.collection.objects.link(light)
+        created_objects.append(light)
+        return light
+
+    objects = []
+    for index in range(40):
+        obj = bpy.data.objects.new(f"LinkItem{index}", bpy.data.meshes.new(f"LinkItem{index}"))
+        scene.collection.objects.link(obj)
+        created_objects.append(obj)
+        objects.append(obj)
+    collections = []
+    for index in range(8):
+        coll = bpy.data.collections.new(f"LinkGroup{index}")
+        scene.collection.children.link(coll)
+        created_collections.append(coll)
+        collections.append(coll)
+
+    yield new_light, objects + collections
+
+    for obj in created_objects:
+        data = obj.data
+        bpy.data.objects.remove(obj)
+        if data is not None and data.users == 0:
+            if isinstance(data, bpy.types.Light):
+                bpy.data.lights.remove(data)
+            else:
+                bpy.data.meshes.remove(data)
+    for coll in created_collections:
+        bpy.data.collections.remove(coll)
+
+
+def _membership(addon, light):
+    """Linked items and their link states per channel; safe helpers only as a marker."""
+    is_safe = addon.utils.is_safe_helper_object
+    result = []
+    for coll in (light.light_linking.receiver_collection, light.light_linking.blocker_collection):
+        if coll is None:
+            result.append(None)
+            continue
+        objects = sorted(
+            ("<safe>" if is_safe(obj) else obj.name, coll_obj.light_linking.link_state)
+            for obj, coll_obj in zip(coll.objects, coll.collection_objects)
+        )
+        children = sorted(
+            (child.name, coll_child.light_linking.link_state)
+            for child, coll_child in zip(coll.children, coll.collection_children)
+        )
+        result.append((objects, children))
+    return result
+
+
+def _link_one_at_a_time(addon, light, items, coll_types, enabled, restore_default_when_empty=False):
+    utils = addon.utils
+    with utils.linking_batch():
+        for item in items:
+            for coll_type in coll_types:
+                utils.link_item_to_channel(
+                    light, item, coll_type, enabled,
+                    restore_default_when_empty=restore_default_when_empty,
+                )
+
+
+BOTH = ("RECEIVER", "BLOCKER")
+
+
+@pytest.mark.parametrize("mode", ["INCLUDE", "EXCLUDE"])
+@pytest.mark.parametrize("channels", [BOTH, ("RECEIVER",), ("BLOCKER",)])
+def test_link_and_unlink_match_single_item_path(addon, scene_items, mode, channels):
+    utils = addon.utils
+    coll_types = tuple(utils.CollectionType[name] for name in channels)
+    new_light, items = scene_items
+    single = new_light("SingleLight")
+    bulk = new_light("BulkLight")
+    for light in (single, bulk):
+        light.light_helper_property.linking_mode = mode
+        # Some items are already linked, so only the difference has to change.
+        _link_one_at_a_time(addon, light, items[::5], (utils.CollectionType.RECEIVER,), True)
+
+    _link_one_at_a_time(addon, single, items, coll_types, True)
+    utils.link_items_to_channels(bulk, items, coll_types)
+    assert _membership(addon, single) == _membership(addon, bulk)
+
+    removed = items[::3]
+    _link_one_at_a_time(addon, single, removed, coll_types, False)
+    utils.link_items_to_channels(bulk, removed, coll_types, enabled=False)
+    assert _membership(addon, single) == _membership(addon, bulk)
+
+
+def test_unlinking_everything_restores_default_linking(addon, scene_items):
+    utils = addon.utils
+    coll_types = (utils.CollectionType.RECEIVER, utils.CollectionType.BLOCKER)
+    new_light, items = scene_items
+    single = new_light("SingleLight")
+    bulk = new_light("BulkLight")
+    for light in (single, bulk):
+        _link_one_at_a_time(addon, light, items, coll_types, True)
+
+    _link_one_at_a_time(addon, single, items, coll_types, False, restore_default_when_empty=True)
+    utils.link_items_to_channels(bulk, items, coll_types, enabled=False, restore_default_when_empty=True)
+    assert _membership(addon, single) == _membership(addon, bulk) == [None, None]
+
+
+def test_change_count(addon, scene_items):
+    utils = addon.utils
+    new_light, items = scene_items
+    light = new_light("CountLight")
+    assert utils.link_items_to_channels(light, items) == 2 * len(items)
+    assert utils.link_items_to_channels(light, items) == 0
+    assert utils.link_items_to_channels(light, items[:10], enabled=False) == 20
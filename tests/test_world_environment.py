@@ -0,0 +1,133 @@
+"""World node-graph traversal on reconverging stress graphs built from plain stub objects."""
+
+import pytest
+
+from node_stubs import Expansions, Node, Socket, Tree
+
+
+@pytest.fixture
+def world_environment(addon):
+    return addon.utils.world_environment
+
+
+def _mix_ladder(rungs):
+    """Each mix node takes both inputs from the one below: ``2 ** rungs`` paths to the texture."""
+    expansions = Expansions()
+    environment = Node("TEX_ENVIRONMENT", expansions)
+    environment.image = object()
+    below = environment
+    for _ in range(rungs):
+        mix = Node("MIX_SHADER", expansions, 2)
+        for socket in mix._inputs:
+            socket.link_from(below)
+        below = mix
+    background = Node("BACKGROUND", expansions, 2)
+    background._inputs[0].link_from(below)
+    surface = Socket(identifier="Surface")
+    surface.link_from(background)
+    return surface, environment, background, expansions
+
+
+@pytest.mark.parametrize("rungs", [10, 20, 60, 1000])
+def test_reconverging_ladder_expands_each_node_once(world_environment, rungs):
+    surface, environment, background, expansions = _mix_ladder(rungs)
+    candidates, connected_env, connected_backgrounds = world_environment._collect_connected_nodes(
+        surface, Tree(), rungs + 1)
+    # The background and every mix node are expanded once; the texture is a leaf.
+    assert len(expansions) == rungs + 1
+    assert len(set(map(id, expansions))) == len(expansions)
+    assert [(depth, node) for depth, node, _, _ in candidates] == [(rungs + 1, environment)]
+    assert candidates[0][3] == (background, ())
+    assert connected_env == [(environment, ())]
+    assert connected_backgrounds == [(0, background, ())]
+
+
+def test_ladder_respects_max_depth(world_environment):
+    surface, _, _, _ = _mix_ladder(30)
+    candidates, connected_env, _ = world_environment._collect_connected_nodes(surface, Tree(), 30)
+    assert candidates == []
+    assert connected_env == []
+
+
+def test_shallowest_candidate_wins_over_longer_branch(world_environment):
+    expansions = Expansions()
+    near = Node("TEX_ENVIRONMENT", expansions)
+    far = Node("TEX_ENVIRONMENT", expansions)
+    near.image = far.image = object()
+    chain = far
+    for _ in range(5):
+        mix = Node("MIX_SHADER", expansions, 1)
+        mix._inputs[0].link_from(chain)
+        chain = mix
+    background = Node("BACKGROUND", expansions, 2)
+    background._inputs[0].link_from(chain)
+    background._inputs[1].link_from(near)
+    surface = Socket(identifier="Surface")
+    surface.link_from(background)
+    candidates, _, _ = world_environment._collect_connected_nodes(surface, Tree(), 64)
+    assert min(candidates, key=lambda item: item[0])[1] is near
+    assert sorted(depth for depth, *_ in candidates) == [1, 6]
+
+
+def _combine_ladder(rungs, value):
+    """Combine XYZ nodes whose three inputs all read the node below: ``3 ** rungs`` walks."""
+    expansions = Expansions()
+    below = Node("VALUE", expansions, default_value=value)
+    for _ in range(rungs):
+        combine = Node("COMBXYZ", expansions, 3)
+        for socket in combine._inputs:
+            socket.link_from(below)
+        below = combine
+    top = Socket(identifier="Location")
+    top.link_from(below)
+    return top, expansions
+
+
+@pytest.mark.parametrize("rungs", [12, 40])
+def test_resolve_socket_value_memo_resolves_each_node_once(world_environment, monkeypatch, rungs):
+    resolved = []
+    resolve_output_value = world_environment._resolve_output_value
+
+    def counting(node, *args):
+        resolved.append(node)
+        return resolve_output_value(node, *args)
+
+    monkeypatch.setattr(world_environment, "_resolve_output_value", counting)
+    top, _ = _combine_ladder(rungs, 0.5)
+    world_environment._resolve_socket_value(top, Tree(), (), memo={})
+    # Every Combine XYZ node plus the value node at the bottom.
+    assert len(resolved) == rungs + 1
+    assert len(set(map(id, resolved))) == len(resolved)
+
+
+def test_resolve_socket_value_with_memo_matches_without(world_environment):
+    for rungs in range(1, 6):
+        top, _ = _combine_ladder(rungs, 0.5)
+        tree = Tree()
+        assert (world_environment._resolve_socket_value(top, tree, (), memo={})
+                == world_environment._resolve_socket_value(top, tree, ()))
+    top, _ = _combine_ladder(1, 0.5)
+    assert world_environment._resolve_socket_value(top, Tree(), (), memo={}) == (0.5, 0.5, 0.5)
+
+
+def test_depth_limited_value_does_not_poison_shallow_lookup(world_environment, monkeypatch):
+    resolved = []
+    resolve_output_value = world_environment._resolve_output_value
+
+    def counting(node, *args):
+        resolved.append(node)
+        return resolve_output_value(node, *args)
+
+    monkeypatch.setattr(world_environment, "_resolve_output_value", counting)
+    rungs = world_environment.DEFAULT_SEARCH_DEPTH + 1
+    top, expansions = _combine_ladder(rungs, 0.5)
+    tree = Tree()
+    memo = {}
+    # The value node sits past the depth limit, so the walk from the top is cut short...
+    assert world_environment._resolve_socket_value(top, tree, (), memo=memo) is None
+    # ...but still reaches every node once rather than 3 ** depth times.
+    assert len(resolved) == rungs
+    # The same bottom rung read from a shallow socket resolves in full.
+    shallow = Socket(identifier="Location")
+    shallow.link_from(expansions.created[1])
+    assert world_environment._resolve_socket_value(shallow, tree, (), memo=memo) == (0.5, 0.5, 0.5)
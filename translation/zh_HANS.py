@@ -20,6 +20,7 @@ data = {
     'Disabled for render: excluded from final render output': '渲染禁用：不参与最终渲染输出',
     'Light Linking': '灯光链接',
     'Object Linking': '物体链接',
+    'Scanning light sources...': '正在扫描光源...',
     'Init': '初始化',
     "A light can't be an affected object": '灯光不能作为被影响的物体',
     'No linking lights are affecting this object': '没有链接型灯光影响此物体',
@@ -38,6 +39,8 @@ data = {
     'Light linking collections are now single-user': '灯光链接集合已变为单用户',
     'Auto Fix Shared Linking': '自动修复共享链接',
     'Opt in to splitting shared light-linking collections for explicitly detected duplicates; never runs while opening a file': '可选：仅在明确检测到重复时拆分共享灯光链接集合；打开文件时不会运行',
+    'Auto Fix Delay': '自动修复延迟',
+    'Seconds without scene changes to wait before fixing shared linking, so editing is never interrupted': '场景停止变化多少秒后再修复共享链接，避免打断编辑',
     'No filtered lights in the list': '列表中没有符合筛选条件的灯光',
     'No object selected': '未选择物体',
     'Drag and Drop to Add': '拖拽添加',
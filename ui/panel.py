@@ -371,6 +371,7 @@ class VIEW3D_PT_light_helper_light_control(bpy.types.Panel):
             LLP_OT_invert_filter_show,
             LLP_OT_switch_filter_show,
         )
+        from ..filter import get_light_source_scan_progress
         from .ui_list import LLT_UL_light
 
         pref = get_pref(context)
@@ -392,10 +393,15 @@ class VIEW3D_PT_light_helper_light_control(bpy.types.Panel):
         col.prop(pref, "auto_fix_shared_linking", text="", icon='AUTO', toggle=True)
         row.template_list(
             LLT_UL_light.__name__, "",
-            context.scene, "objects",
+            context.scene.light_helper_property, "light_sources",
             context.scene.light_helper_property, "active_object_index",
             rows=7,
         )
+        progress = get_light_source_scan_progress(context)
+        if progress is not None:
+            column.progress(factor=progress, type='BAR', text=p_("Scanning light sources..."))
+
+
 class VIEW3D_PT_light_helper_object_control(bpy.types.Panel):
     bl_label = ""
     bl_idname = "VIEW3D_PT_light_helper_object_control"
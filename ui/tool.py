@@ -250,6 +250,7 @@ _syncing_list_index = False
 def sync_list_from_selection(context: bpy.types.Context) -> bool:
     """Keep sidebar UIList highlight in sync with Outliner/viewport active object."""
     global _syncing_list_index
+    from ..filter import light_source_registry_index
     from ..utils import resolve_original_id
 
     obj = resolve_original_id(context.view_layer.objects.active or context.object)
@@ -257,10 +258,7 @@ def sync_list_from_selection(context: bpy.types.Context) -> bool:
         return False
 
     scene_props = context.scene.light_helper_property
-    objects = context.scene.objects
-    index = objects.find(obj.name)
-    if index < 0 or objects[index] != obj:
-        return False
+    index = light_source_registry_index(context.scene, obj)
     if index < 0:
         return False
     if scene_props.active_object_index == index:
@@ -318,8 +316,7 @@ def _on_tool_changed(*_args):
     schedule_session_sync()
 
 
-@bpy.app.handlers.persistent
-def _depsgraph_sync_selection(_scene, _depsgraph):
+def _depsgraph_sync_selection(_scene, _summary):
     """Session-only fallback for tool and sidebar selection synchronization."""
     try:
         context = bpy.context
@@ -337,8 +334,8 @@ def _register_depsgraph_sync() -> None:
     global _depsgraph_sync_registered
     if _depsgraph_sync_registered:
         return
-    if _depsgraph_sync_selection not in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.append(_depsgraph_sync_selection)
+    from ..handlers import subscribe_depsgraph
+    subscribe_depsgraph(_depsgraph_sync_selection)
     _depsgraph_sync_registered = True
 
 
@@ -346,8 +343,8 @@ def _unregister_depsgraph_sync() -> None:
     global _depsgraph_sync_registered
     if not _depsgraph_sync_registered:
         return
-    if _depsgraph_sync_selection in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(_depsgraph_sync_selection)
+    from ..handlers import unsubscribe_depsgraph
+    unsubscribe_depsgraph(_depsgraph_sync_selection)
     _depsgraph_sync_registered = False
 
 
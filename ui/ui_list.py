@@ -1,13 +1,16 @@
 import bpy
 from bpy.app.translations import pgettext_iface as p_
 
+from ..utils.cache import LRUCache
 from ..utils.icon import get_item_icon
 
 _TCTX = "light_helper_zh_CN"
-_UI_LIST_FILTER_CACHE = {}
+_UI_LIST_FILTER_CACHE = LRUCache("ui_list_filter", 32)
 
 
 def _ui_list_cache_key(context, list_type, generation, bitflag, uilist):
+    from ..utils import get_linking_ui_cache_generation
+
     return (
         list_type,
         context.scene.as_pointer(),
@@ -20,6 +23,8 @@ def _ui_list_cache_key(context, list_type, generation, bitflag, uilist):
         bool(uilist.use_filter_invert),
         bool(uilist.filter_hide_not_shown),
         uilist.sort_type,
+        # Link counts follow linking edits, which do not bump the filter generation.
+        get_linking_ui_cache_generation() if uilist.sort_type == "LINK_COUNT" else 0,
     )
 
 
@@ -32,21 +37,48 @@ def _cached_ui_list_result(key):
 
 
 def _store_ui_list_result(key, flags, order):
-    if len(_UI_LIST_FILTER_CACHE) > 32:
-        _UI_LIST_FILTER_CACHE.clear()
     _UI_LIST_FILTER_CACHE[key] = (tuple(flags), tuple(order))
     return flags, order
 
 
-def _apply_name_filter(helper_funcs, objects, flt_flags, filter_name, use_filter_invert, bitflag):
-    if not filter_name:
-        return flt_flags
-    name_flags = helper_funcs.filter_items_by_name(
-        filter_name, bitflag, objects, "name", reverse=use_filter_invert,
-    )
-    if not name_flags:
+_NAME_FILTER_WILDCARDS = frozenset("*?[")
+# List type -> (dataset key, pattern, indices whose name matched the pattern).
+_name_filter_results: dict[str, tuple] = {}
+
+
+def _name_matches(helper_funcs, objects, filter_name, dataset_key, list_type):
+    """Indices of ``objects`` matching ``filter_name``.
+
+    Without wildcards the implicit ``*pattern*`` match only narrows as the
+    pattern grows, so a pattern containing the previous one is tested
+    against the previous matches instead of every object.
+    """
+    previous = _name_filter_results.get(list_type)
+    if (
+            previous is not None
+            and previous[0] == dataset_key
+            and previous[1] in filter_name
+            and not _NAME_FILTER_WILDCARDS.intersection(filter_name)
+    ):
+        candidates = previous[2]
+    else:
+        candidates = range(len(objects))
+    subset = [objects[i] for i in candidates]
+    flags = helper_funcs.filter_items_by_name(filter_name, 1, subset, "name")
+    matches = tuple(i for i, flag in zip(candidates, flags) if flag)
+    _name_filter_results[list_type] = (dataset_key, filter_name, matches)
+    return matches
+
+
+def _apply_name_filter(helper_funcs, objects, flt_flags, filter_name, use_filter_invert,
+                       dataset_key, list_type):
+    if not filter_name or not objects:
         return flt_flags
-    return [flag & name_flag for flag, name_flag in zip(flt_flags, name_flags)]
+    matches = set(_name_matches(helper_funcs, objects, filter_name, dataset_key, list_type))
+    return [
+        flag if (i in matches) is not bool(use_filter_invert) else 0
+        for i, flag in enumerate(flt_flags)
+    ]
 
 
 def _apply_hide_not_shown(context, objects, flt_flags, bitflag):
@@ -58,12 +90,75 @@ def _apply_hide_not_shown(context, objects, flt_flags, bitflag):
     ]
 
 
-def _sort_by_link_count(helper_funcs, objects, count_fn):
+def _sort_by_link_count(helper_funcs, objects, flt_flags, count_fn):
+    """Order by descending link count; keys are only computed for rows that pass the filter."""
+    # Hidden rows share one key and sink to the end in their original order.
     sort_data = [
-        (i, count_fn(obj), obj.name.casefold())
-        for i, obj in enumerate(objects)
+        (i, (0, -count_fn(obj), obj.name.casefold()) if flag else (1,))
+        for i, (obj, flag) in enumerate(zip(objects, flt_flags))
     ]
-    return helper_funcs.sort_items_helper(sort_data, lambda e: (-e[1], e[2]))
+    return helper_funcs.sort_items_helper(sort_data, lambda e: e[1])
+
+
+class _LightRow:
+    """Per-row values ``LLT_UL_light.draw_item`` would otherwise recompute on every redraw."""
+    __slots__ = ("index", "has_link", "solo_active")
+
+    def __init__(self, index, has_link, solo_active):
+        self.index = index
+        self.has_link = has_link
+        self.solo_active = solo_active
+
+
+# Object pointer -> _LightRow, valid for one (scene, filter generation, solo light).
+_light_rows: dict[int, _LightRow] = {}
+_light_rows_key = None
+
+
+def _light_row(obj, index, solo):
+    from ..utils import check_link
+
+    return _LightRow(index, check_link(obj), solo is not None and solo == obj)
+
+
+def _ensure_light_rows(context, sources, generation):
+    """Rebuild the row model for the light-source registry once per filter generation."""
+    global _light_rows_key
+    solo = context.window_manager.light_helper_property.solo_light
+    key = (
+        context.scene.as_pointer(),
+        len(sources),
+        generation,
+        solo.as_pointer() if solo is not None else 0,
+    )
+    if key == _light_rows_key:
+        return
+    _light_rows.clear()
+    for index, source in enumerate(sources):
+        obj = source.object
+        if obj is not None:
+            _light_rows[obj.as_pointer()] = _light_row(obj, index, solo)
+    _light_rows_key = key
+
+
+class _MissingSource:
+    """Stands in for a registry entry whose object was deleted until the registry catches up."""
+    name = ""
+    type = ""
+
+
+def _row_link_count(obj) -> int:
+    from ..utils import get_cached_light_link_item_count
+
+    row_data = _light_rows.get(obj.as_pointer()) if obj is not _MissingSource else None
+    if row_data is None or not row_data.has_link:
+        return 0
+    # Only counted for drawn or sorted rows, and kept until linking data changes.
+    return get_cached_light_link_item_count(obj)
+
+
+def _registry_objects(sources):
+    return [source.object or _MissingSource for source in sources]
 
 
 def _draw_search_row(layout, uilist):
@@ -136,14 +231,23 @@ class LLT_UL_light(bpy.types.UIList):
         layout.prop(self, "filter_hide_not_shown", toggle=True)
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
-        from ..utils import check_link, get_light_link_item_count, is_shown_in_view_layer
+        from ..filter import light_source_registry_index
+        from ..utils import get_cached_light_link_item_count, is_shown_in_view_layer
         from ..ops import LLP_OT_add_light_linking, LLP_OT_clear_light_linking, LLP_OT_solo_light
 
-        props = item.light_helper_property
-        index = context.scene.objects.find(item.name)
-        if index < 0:
+        item = item.object
+        if item is None:
             return
-        has_link = check_link(item)
+        props = item.light_helper_property
+        row_data = _light_rows.get(item.as_pointer())
+        if row_data is None:
+            # Drawn before filter_items refreshed the model for this generation.
+            index = light_source_registry_index(context.scene, item)
+            if index < 0:
+                return
+            row_data = _light_row(item, index, context.window_manager.light_helper_property.solo_light)
+        index = row_data.index
+        has_link = row_data.has_link
 
         row = layout.row(align=True)
         if not is_shown_in_view_layer(context, item):
@@ -162,8 +266,7 @@ class LLT_UL_light(bpy.types.UIList):
             left.prop(props, "show_render", text="", icon=render_icon, emboss=False)
 
         if item.type == "LIGHT":
-            solo = context.window_manager.light_helper_property.solo_light
-            solo_active = solo is not None and solo == item
+            solo_active = row_data.solo_active
             solo_row = left.row(align=True)
             solo_row.context_pointer_set("solo_light_object", item)
             op = solo_row.operator(
@@ -184,7 +287,7 @@ class LLT_UL_light(bpy.types.UIList):
             info_right.label(text=item.type.title())
         info_right.label(text=item.name, translate=False)
         if self.show_link_count and has_link:
-            count = get_light_link_item_count(item)
+            count = get_cached_light_link_item_count(item)
             info_right.label(text=_format_list_link_count(context, count, "Links: %d"))
 
         action = rest.row(align=True)
@@ -199,23 +302,28 @@ class LLT_UL_light(bpy.types.UIList):
                 op.init = True
 
     def filter_items(self, context, data, propname):
-        from ..filter import filter_list, get_filter_cache_generation
-        from ..utils import get_light_link_item_count
+        from ..filter import ensure_light_source_registry, filter_light_sources, get_filter_cache_generation
+        from ..handlers import ensure_filter_cache_invalidation_handler
 
         helper_funcs = bpy.types.UI_UL_list
         bitflag = self.bitflag_filter_item
 
-        flt_flags = filter_list(context, bitflag)
-        key = _ui_list_cache_key(
-            context, "LIGHT", get_filter_cache_generation(), bitflag, self,
-        )
+        # Rows come from the light-source registry, so cost follows the light count.
+        ensure_filter_cache_invalidation_handler()
+        ensure_light_source_registry(context)
+        sources = getattr(data, propname)
+        generation = get_filter_cache_generation()
+        _ensure_light_rows(context, sources, generation)
+        key = _ui_list_cache_key(context, "LIGHT", generation, bitflag, self)
         cached = _cached_ui_list_result(key)
-        if cached is not None:
+        if cached is not None and len(cached[0]) == len(sources):
             return cached
 
-        objects = getattr(data, propname)[:]
+        objects = _registry_objects(sources)
+        flt_flags = filter_light_sources(context, [source.object for source in sources], bitflag)
         flt_flags = _apply_name_filter(
-            helper_funcs, objects, flt_flags, self.filter_name, self.use_filter_invert, bitflag,
+            helper_funcs, objects, flt_flags, self.filter_name, self.use_filter_invert,
+            (context.scene.as_pointer(), generation, len(objects)), "LIGHT",
         )
         if self.filter_hide_not_shown:
             flt_flags = _apply_hide_not_shown(context, objects, flt_flags, bitflag)
@@ -223,7 +331,7 @@ class LLT_UL_light(bpy.types.UIList):
         if self.sort_type == "TYPE":
             flt_neworder = helper_funcs.sort_items_by_name(objects, "type")
         elif self.sort_type == "LINK_COUNT":
-            flt_neworder = _sort_by_link_count(helper_funcs, objects, get_light_link_item_count)
+            flt_neworder = _sort_by_link_count(helper_funcs, objects, flt_flags, _row_link_count)
         elif self.sort_type == "NAME":
             flt_neworder = helper_funcs.sort_items_by_name(objects, "name")
         else:
@@ -288,14 +396,13 @@ class LLT_UL_linked_object(bpy.types.UIList):
     def filter_items(self, context, data, propname):
         from ..filter import get_filter_cache_generation
         from ..handlers import ensure_filter_cache_invalidation_handler
-        from ..utils import get_object_link_light_count, iter_objects_linked_by_lights
+        from ..utils import get_object_link_light_counts, iter_objects_linked_by_lights
 
         helper_funcs = bpy.types.UI_UL_list
         bitflag = self.bitflag_filter_item
         ensure_filter_cache_invalidation_handler()
-        key = _ui_list_cache_key(
-            context, "LINKED_OBJECT", get_filter_cache_generation(), bitflag, self,
-        )
+        generation = get_filter_cache_generation()
+        key = _ui_list_cache_key(context, "LINKED_OBJECT", generation, bitflag, self)
         cached = _cached_ui_list_result(key)
         if cached is not None:
             return cached
@@ -308,7 +415,8 @@ class LLT_UL_linked_object(bpy.types.UIList):
             for obj in objects
         ]
         flt_flags = _apply_name_filter(
-            helper_funcs, objects, flt_flags, self.filter_name, self.use_filter_invert, bitflag,
+            helper_funcs, objects, flt_flags, self.filter_name, self.use_filter_invert,
+            (context.scene.as_pointer(), generation, len(objects)), "LINKED_OBJECT",
         )
         if self.filter_hide_not_shown:
             flt_flags = _apply_hide_not_shown(context, objects, flt_flags, bitflag)
@@ -316,10 +424,12 @@ class LLT_UL_linked_object(bpy.types.UIList):
         if self.sort_type == "TYPE":
             flt_neworder = helper_funcs.sort_items_by_name(objects, "type")
         elif self.sort_type == "LINK_COUNT":
+            counts = get_object_link_light_counts(context)
             flt_neworder = _sort_by_link_count(
                 helper_funcs,
                 objects,
-                lambda obj: get_object_link_light_count(obj, context),
+                flt_flags,
+                lambda obj: counts.get(obj.as_pointer(), 0),
             )
         elif self.sort_type == "NAME":
             flt_neworder = helper_funcs.sort_items_by_name(objects, "name")
@@ -329,13 +439,23 @@ class LLT_UL_linked_object(bpy.types.UIList):
         return _store_ui_list_result(key, flt_flags, flt_neworder)
 
 
+def invalidate_light_rows() -> None:
+    global _light_rows_key
+    _light_rows.clear()
+    _light_rows_key = None
+
+
 def register():
     _UI_LIST_FILTER_CACHE.clear()
+    _name_filter_results.clear()
+    invalidate_light_rows()
     bpy.utils.register_class(LLT_UL_light)
     bpy.utils.register_class(LLT_UL_linked_object)
 
 
 def unregister():
     _UI_LIST_FILTER_CACHE.clear()
+    _name_filter_results.clear()
+    invalidate_light_rows()
     bpy.utils.unregister_class(LLT_UL_linked_object)
     bpy.utils.unregister_class(LLT_UL_light)
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from enum import Enum, unique
 from uuid import uuid4
 
@@ -53,15 +54,48 @@ def _light_owner_uuid(light: bpy.types.Object, create: bool = False) -> str | No
     return owner_uuid
 
 
+# Owner UUID -> safe helper object; built on first lookup, dropped on undo and file load.
+_safe_helper_index: dict[str, bpy.types.Object] | None = None
+
+
+def invalidate_safe_helper_index() -> None:
+    global _safe_helper_index
+    _safe_helper_index = None
+
+
+def _ensure_safe_helper_index() -> dict[str, bpy.types.Object]:
+    global _safe_helper_index
+    if _safe_helper_index is None:
+        index = {}
+        for obj in bpy.data.objects:
+            if not is_safe_helper_object(obj):
+                continue
+            owner_uuid = obj.get(LIGHT_HELPER_SAFE_OWNER_KEY)
+            if isinstance(owner_uuid, str) and owner_uuid:
+                index.setdefault(owner_uuid, obj)
+        _safe_helper_index = index
+    return _safe_helper_index
+
+
 def get_safe_obj(light: bpy.types.Object) -> bpy.types.Object | None:
     owner_uuid = _light_owner_uuid(light)
     if owner_uuid is None:
         return None
-    for obj in bpy.data.objects:
-        if (is_safe_helper_object(obj)
-                and obj.get(LIGHT_HELPER_SAFE_OWNER_KEY) == owner_uuid):
-            return obj
-    return None
+    index = _ensure_safe_helper_index()
+    safe = index.get(owner_uuid)
+    if safe is None:
+        return None
+    try:
+        # ID wrappers are reused, so identity confirms the helper still lives in bpy.data.
+        valid = (bpy.data.objects.get(safe.name) is safe
+                 and is_safe_helper_object(safe)
+                 and safe.get(LIGHT_HELPER_SAFE_OWNER_KEY) == owner_uuid)
+    except ReferenceError:
+        valid = False
+    if not valid:
+        del index[owner_uuid]
+        return None
+    return safe
 
 
 def remove_safe_helper_for_light(light: bpy.types.Object) -> None:
@@ -70,6 +104,7 @@ def remove_safe_helper_for_light(light: bpy.types.Object) -> None:
     if (safe is None or owner_uuid is None
             or safe.get(LIGHT_HELPER_SAFE_OWNER_KEY) != owner_uuid):
         return
+    _safe_helper_index.pop(owner_uuid, None)
     mesh = safe.data if safe.type == 'MESH' else None
     bpy.data.objects.remove(safe, do_unlink=True)
     if mesh is not None and mesh.users == 0:
@@ -91,6 +126,7 @@ def sync_safe_helpers_for_light(light: bpy.types.Object) -> None:
         if has_real:
             for o in safes:
                 coll.objects.unlink(o)
+                _update_collection_membership(coll, o, False)
             continue
         safe = get_safe_obj(light)
         if safe is None:
@@ -103,17 +139,75 @@ def sync_safe_helpers_for_light(light: bpy.types.Object) -> None:
             safe.hide_select = True
             safe[LIGHT_HELPER_SAFE_KEY] = True
             safe[LIGHT_HELPER_SAFE_OWNER_KEY] = owner_uuid
+            _ensure_safe_helper_index()[owner_uuid] = safe
         for o in safes:
             if o != safe:
                 coll.objects.unlink(o)
+                _update_collection_membership(coll, o, False)
         if safe.name not in coll.objects:
             coll.objects.link(safe)
+            _update_collection_membership(coll, safe, True)
         _set_item_link_state(coll, safe, mode)
         used = True
     if not used:
         remove_safe_helper_for_light(light)
 
 
+_linking_batch_depth = 0
+_linking_batch_lights = {}
+_linking_batch_notify = False
+_linking_batch_context = None
+
+
+@contextmanager
+def linking_batch(context: bpy.types.Context | None = None):
+    """Defer safe-helper sync and change notification until the outermost batch exits.
+
+    Each light touched inside the batch is synced once and a single
+    ``notify_linking_changed`` is sent, instead of one per linked item.
+    """
+    global _linking_batch_depth, _linking_batch_notify, _linking_batch_context
+    if _linking_batch_depth == 0:
+        _linking_batch_context = context
+    _linking_batch_depth += 1
+    try:
+        yield
+    finally:
+        _linking_batch_depth -= 1
+        if _linking_batch_depth == 0:
+            lights = list(_linking_batch_lights.values())
+            notify = _linking_batch_notify
+            ctx = _linking_batch_context
+            _linking_batch_lights.clear()
+            _linking_batch_notify = False
+            _linking_batch_context = None
+            for light in lights:
+                try:
+                    sync_safe_helpers_for_light(light)
+                except ReferenceError:
+                    # Removed while the batch was open.
+                    continue
+            if notify:
+                from .overlay import notify_linking_changed
+                notify_linking_changed(ctx)
+
+
+def _linking_changed(light: bpy.types.Object | None, context: bpy.types.Context | None = None) -> None:
+    """Sync ``light``'s safe helper and notify now, or record both for the open batch."""
+    global _linking_batch_notify, _linking_batch_context
+    if _linking_batch_depth:
+        if light is not None:
+            _linking_batch_lights[light.as_pointer()] = light
+        _linking_batch_notify = True
+        if _linking_batch_context is None:
+            _linking_batch_context = context
+        return
+    if light is not None:
+        sync_safe_helpers_for_light(light)
+    from .overlay import notify_linking_changed
+    notify_linking_changed(context)
+
+
 def get_pref(context=None):
     ctx = context if context is not None else bpy.context
     return ctx.preferences.addons[base_package].preferences
@@ -241,6 +335,7 @@ def init_light_linking(light: bpy.types.Object, context: bpy.types.Context | Non
             else:
                 linking.blocker_collection = coll
         mark_managed_linking_collection(coll)
+    update_linking_collection_owners((light,))
     sync_safe_helpers_for_light(light)
 
 
@@ -251,12 +346,66 @@ def ensure_linking_coll(coll_type: CollectionType, light: bpy.types.Object,
     return get_linking_coll(light, coll_type)
 
 
+class _CollectionMembership:
+    __slots__ = ("collection", "objects", "children")
+
+    def __init__(self, coll: bpy.types.Collection):
+        # ID wrappers are reused, so identity tells a freed-and-reused address apart.
+        self.collection = coll
+        self.objects = {obj.as_pointer() for obj in coll.objects}
+        self.children = {child.as_pointer() for child in coll.children}
+
+
+_collection_membership_cache: dict[int, _CollectionMembership] = {}
+
+
+def invalidate_collection_membership_cache(pointers=None) -> None:
+    """Drop cached membership sets, either for the given collection pointers or all of them."""
+    if pointers is None:
+        _collection_membership_cache.clear()
+        _collection_tree_cache.clear()
+        return
+    changed = False
+    for pointer in pointers:
+        _collection_membership_cache.pop(pointer, None)
+        changed = True
+    if changed:
+        # Any nested edit can change the flattened tree of every ancestor.
+        _collection_tree_cache.clear()
+
+
+def _collection_membership(coll: bpy.types.Collection) -> _CollectionMembership:
+    key = coll.as_pointer()
+    membership = _collection_membership_cache.get(key)
+    # Sizes catch edits made outside link_item_to_channel before the depsgraph reports them.
+    if (membership is None
+            or membership.collection is not coll
+            or len(membership.objects) != len(coll.objects)
+            or len(membership.children) != len(coll.children)):
+        from ..handlers import ensure_filter_cache_invalidation_handler
+        ensure_filter_cache_invalidation_handler()
+        membership = _CollectionMembership(coll)
+        _collection_membership_cache[key] = membership
+    return membership
+
+
+def _update_collection_membership(coll: bpy.types.Collection, item, linked: bool) -> None:
+    membership = _collection_membership_cache.get(coll.as_pointer())
+    if membership is None or membership.collection is not coll:
+        return
+    members = membership.objects if isinstance(item, bpy.types.Object) else membership.children
+    if linked:
+        members.add(item.as_pointer())
+    else:
+        members.discard(item.as_pointer())
+
+
 def collection_has_object(coll: bpy.types.Collection, obj: bpy.types.Object) -> bool:
-    return any(member == obj for member in coll.objects)
+    return obj.as_pointer() in _collection_membership(coll).objects
 
 
 def collection_has_child(coll: bpy.types.Collection, child: bpy.types.Collection) -> bool:
-    return any(member == child for member in coll.children)
+    return child.as_pointer() in _collection_membership(coll).children
 
 
 def is_item_in_channel(light: bpy.types.Object, item,
@@ -271,13 +420,55 @@ def is_item_in_channel(light: bpy.types.Object, item,
     return False
 
 
+class _CollectionTree:
+    __slots__ = ("collection", "objects", "pointers")
+
+    def __init__(self, coll: bpy.types.Collection, objects: tuple, pointers: frozenset):
+        self.collection = coll
+        self.objects = objects
+        self.pointers = pointers
+
+
+# Flattened nested membership, valid for one linking UI cache generation.
+_collection_tree_cache: dict[int, _CollectionTree] = {}
+
+
+def _collection_tree(coll: bpy.types.Collection) -> _CollectionTree:
+    key = coll.as_pointer()
+    tree = _collection_tree_cache.get(key)
+    if tree is not None and tree.collection is coll:
+        return tree
+    from ..handlers import ensure_filter_cache_invalidation_handler
+    ensure_filter_cache_invalidation_handler()
+    objects = {}
+    visited = set()
+    stack = [coll]
+    while stack:
+        current = stack.pop()
+        pointer = current.as_pointer()
+        if pointer in visited:
+            continue
+        visited.add(pointer)
+        cached = _collection_tree_cache.get(pointer) if current != coll else None
+        if cached is not None and cached.collection is current:
+            for obj in cached.objects:
+                objects.setdefault(obj.as_pointer(), obj)
+            continue
+        for obj in current.objects:
+            objects.setdefault(obj.as_pointer(), obj)
+        stack.extend(current.children)
+    tree = _CollectionTree(coll, tuple(objects.values()), frozenset(objects))
+    _collection_tree_cache[key] = tree
+    return tree
+
+
+def collection_tree_objects(coll: bpy.types.Collection) -> tuple[bpy.types.Object, ...]:
+    """Objects in ``coll`` and all of its nested child collections."""
+    return _collection_tree(coll).objects
+
+
 def object_in_collection_tree(coll: bpy.types.Collection, obj: bpy.types.Object) -> bool:
-    if collection_has_object(coll, obj):
-        return True
-    for child in coll.children:
-        if object_in_collection_tree(child, obj):
-            return True
-    return False
+    return obj.as_pointer() in _collection_tree(coll).pointers
 
 
 def is_object_affected_in_channel(light: bpy.types.Object, obj: bpy.types.Object,
@@ -287,10 +478,8 @@ def is_object_affected_in_channel(light: bpy.types.Object, obj: bpy.types.Object
     coll = get_linking_coll(light, coll_type)
     if coll is None:
         return False
-    for child in coll.children:
-        if object_in_collection_tree(child, obj):
-            return True
-    return False
+    pointer = obj.as_pointer()
+    return any(pointer in _collection_tree(child).pointers for child in coll.children)
 
 
 def has_real_linking_items(light: bpy.types.Object) -> bool:
@@ -338,16 +527,20 @@ def link_item_to_channel(light: bpy.types.Object, item,
             if enabled:
                 if not collection_has_object(coll, item):
                     coll.objects.link(item)
+                    _update_collection_membership(coll, item, True)
                 _set_item_link_state(coll, item, mode)
             elif collection_has_object(coll, item):
                 coll.objects.unlink(item)
+                _update_collection_membership(coll, item, False)
         elif isinstance(item, bpy.types.Collection):
             if enabled:
                 if not collection_has_child(coll, item):
                     coll.children.link(item)
+                    _update_collection_membership(coll, item, True)
                 _set_item_link_state(coll, item, mode)
             elif collection_has_child(coll, item):
                 coll.children.unlink(item)
+                _update_collection_membership(coll, item, False)
     except RuntimeError:
         return
 
@@ -355,15 +548,14 @@ def link_item_to_channel(light: bpy.types.Object, item,
         restore_light_linking(light, context)
         return
 
-    sync_safe_helpers_for_light(light)
-    from .overlay import notify_linking_changed
-    notify_linking_changed(context)
+    _linking_changed(light, context)
 
 
 def link_item_both_channels(light: bpy.types.Object, item,
                             context: bpy.types.Context | None = None) -> None:
-    link_item_to_channel(light, item, CollectionType.RECEIVER, True, context)
-    link_item_to_channel(light, item, CollectionType.BLOCKER, True, context)
+    with linking_batch(context):
+        link_item_to_channel(light, item, CollectionType.RECEIVER, True, context)
+        link_item_to_channel(light, item, CollectionType.BLOCKER, True, context)
 
 
 def toggle_item_both_channels(light: bpy.types.Object, item,
@@ -375,17 +567,111 @@ def toggle_item_both_channels(light: bpy.types.Object, item,
     receiver = is_item_in_channel(light, item, CollectionType.RECEIVER)
     blocker = is_item_in_channel(light, item, CollectionType.BLOCKER)
     enable = not (receiver and blocker)
-    link_item_to_channel(
-        light, item, CollectionType.RECEIVER, enable, context,
-        restore_default_when_empty=restore_default_when_empty,
-    )
-    link_item_to_channel(
-        light, item, CollectionType.BLOCKER, enable, context,
-        restore_default_when_empty=restore_default_when_empty,
-    )
+    with linking_batch(context):
+        link_item_to_channel(
+            light, item, CollectionType.RECEIVER, enable, context,
+            restore_default_when_empty=restore_default_when_empty,
+        )
+        link_item_to_channel(
+            light, item, CollectionType.BLOCKER, enable, context,
+            restore_default_when_empty=restore_default_when_empty,
+        )
     return enable
 
 
+def _link_items_in_collection(coll: bpy.types.Collection, targets: dict, enabled: bool) -> set:
+    """Link or unlink only the targets whose membership differs; returns pointers now linked."""
+    membership = _collection_membership(coll)
+    linked = set()
+    for pointer, item in targets.items():
+        is_object = isinstance(item, bpy.types.Object)
+        members = membership.objects if is_object else membership.children
+        present = pointer in members
+        if present == enabled:
+            if enabled:
+                linked.add(pointer)
+            continue
+        try:
+            if is_object:
+                if enabled:
+                    coll.objects.link(item)
+                else:
+                    coll.objects.unlink(item)
+            elif enabled:
+                coll.children.link(item)
+            else:
+                coll.children.unlink(item)
+        except RuntimeError:
+            continue
+        if enabled:
+            members.add(pointer)
+            linked.add(pointer)
+        else:
+            members.discard(pointer)
+    return linked
+
+
+def _set_items_link_state(coll: bpy.types.Collection, pointers: set, mode: str) -> None:
+    """Apply ``mode`` to every listed member in one walk of the collection."""
+    if not pointers:
+        return
+    for obj, coll_obj in zip(coll.objects, coll.collection_objects):
+        if obj.as_pointer() in pointers:
+            coll_obj.light_linking.link_state = mode
+    for child, coll_child in zip(coll.children, coll.collection_children):
+        if child.as_pointer() in pointers:
+            coll_child.light_linking.link_state = mode
+
+
+def link_items_to_channels(light: bpy.types.Object, items,
+                           coll_types=(CollectionType.RECEIVER, CollectionType.BLOCKER),
+                           enabled: bool = True,
+                           context: bpy.types.Context | None = None, *,
+                           restore_default_when_empty: bool = False) -> int:
+    """Bulk form of ``link_item_to_channel`` for many items and channels.
+
+    The targets are diffed against each channel's membership in one pass, so
+    only the difference is linked or unlinked. Returns the number of changes.
+    """
+    light = resolve_original_id(light)
+    if not is_original_id(light):
+        return 0
+    targets = {}
+    for item in items:
+        item = resolve_original_id(item)
+        if (isinstance(item, (bpy.types.Object, bpy.types.Collection))
+                and is_original_id(item)):
+            targets[item.as_pointer()] = item
+    if not targets:
+        return 0
+    mode = get_linking_mode(light)
+    changed = 0
+    touched = False
+    for coll_type in coll_types:
+        coll = get_linking_coll(light, coll_type)
+        if coll is None:
+            if not enabled:
+                continue
+            try:
+                coll = ensure_linking_coll(coll_type, light, context)
+            except RuntimeError:
+                continue
+        before = len(coll.objects) + len(coll.children)
+        linked = _link_items_in_collection(coll, targets, enabled)
+        changed += abs(len(coll.objects) + len(coll.children) - before)
+        _set_items_link_state(coll, linked, mode)
+        touched = True
+    if not touched:
+        return changed
+
+    if restore_default_when_empty and not enabled and not has_real_linking_items(light):
+        restore_light_linking(light, context)
+        return changed
+
+    _linking_changed(light, context)
+    return changed
+
+
 def supports_emissive_light_sources(context: bpy.types.Context | None = None) -> bool:
     """Whether material-emission objects can act as Light Linking sources.
 
@@ -497,22 +783,97 @@ def select_tool_light(context: bpy.types.Context, light: bpy.types.Object) -> No
             obj.select_set(False)
         view_layer.objects.active = light
         light.select_set(True)
-    objects = context.scene.objects[:]
-    if light in objects:
-        context.scene.light_helper_property.active_object_index = objects.index(light)
+    from ..filter import light_source_registry_index
+    index = light_source_registry_index(context.scene, light)
+    if index >= 0:
+        context.scene.light_helper_property.active_object_index = index
     if is_in_view_layer(context, light):
         view_selected(context)
 
 
-def remove_orphaned_managed_collection(coll: bpy.types.Collection | None) -> None:
-    if coll is None or not is_managed_linking_collection(coll):
+# Linking collection pointer -> {object pointer: object}; None until first queried.
+# Entries may go stale and are verified on read, so only missing owners matter.
+_collection_owners: dict[int, dict] | None = None
+
+
+def invalidate_linking_collection_owners() -> None:
+    global _collection_owners
+    _collection_owners = None
+
+
+def _track_linking_collections(obj: bpy.types.Object) -> None:
+    if not hasattr(obj, "light_linking"):
         return
+    linking = obj.light_linking
+    pointer = obj.as_pointer()
+    for coll in (linking.receiver_collection, linking.blocker_collection):
+        if coll is not None:
+            _collection_owners.setdefault(coll.as_pointer(), {})[pointer] = obj
+
+
+def update_linking_collection_owners(objects) -> None:
+    """Record the current linking collections of ``objects`` in the owner map."""
+    if _collection_owners is None:
+        return
+    for obj in objects:
+        try:
+            _track_linking_collections(obj)
+        except ReferenceError:
+            continue
+
+
+def _ensure_linking_collection_owners() -> dict:
+    global _collection_owners
+    if _collection_owners is None:
+        from ..handlers import ensure_linking_collection_owner_handler
+        ensure_linking_collection_owner_handler()
+        _collection_owners = {}
+        for obj in bpy.data.objects:
+            _track_linking_collections(obj)
+    return _collection_owners
+
+
+def get_linking_collection_owners(coll: bpy.types.Collection) -> list[bpy.types.Object]:
+    """Objects that use ``coll`` as their light or shadow linking collection."""
+    owners = _ensure_linking_collection_owners().get(coll.as_pointer())
+    if not owners:
+        return []
+    result = []
+    for pointer, obj in list(owners.items()):
+        try:
+            linking = obj.light_linking
+            owned = linking.receiver_collection == coll or linking.blocker_collection == coll
+        except ReferenceError:
+            owned = False
+        if owned:
+            result.append(obj)
+        else:
+            del owners[pointer]
+    return result
+
+
+def _is_collection_owned(coll: bpy.types.Collection) -> bool:
+    if get_linking_collection_owners(coll):
+        return True
+    if coll.users == 0:
+        return False
+    # Other users may be owners assigned since the last depsgraph update; confirm by scanning.
     for obj in bpy.data.objects:
         if not hasattr(obj, "light_linking"):
             continue
         linking = obj.light_linking
         if linking.receiver_collection == coll or linking.blocker_collection == coll:
-            return
+            update_linking_collection_owners((obj,))
+            return True
+    return False
+
+
+def remove_orphaned_managed_collection(coll: bpy.types.Collection | None) -> None:
+    if coll is None or not is_managed_linking_collection(coll):
+        return
+    if _is_collection_owned(coll):
+        return
+    invalidate_collection_membership_cache((coll.as_pointer(),))
     bpy.data.collections.remove(coll)
 
 
@@ -543,8 +904,9 @@ def restore_light_linking(light: bpy.types.Object, context: bpy.types.Context |
         from .world_environment import ensure_sun_exclusions
         for scene, dome in active_world_domes:
             ensure_sun_exclusions(scene, dome, [light])
-    from .overlay import notify_linking_changed
-    notify_linking_changed(context)
+    # The light no longer owns linking collections, so a deferred sync has nothing to do.
+    _linking_batch_lights.pop(light.as_pointer(), None)
+    _linking_changed(None, context)
 
 
 def get_light_effect_obj_state(light: bpy.types.Object, obj: bpy.types.Object) -> dict:
@@ -614,6 +976,15 @@ def get_light_link_item_count(light: bpy.types.Object) -> int:
     return len(get_all_light_effect_items_state(light))
 
 
+def get_cached_light_link_item_count(light: bpy.types.Object) -> int:
+    """``get_light_link_item_count`` memoized for the current linking UI cache generation."""
+    pointer = light.as_pointer()
+    count = _cached_light_link_item_counts.get(pointer)
+    if count is None:
+        count = _cached_light_link_item_counts[pointer] = get_light_link_item_count(light)
+    return count
+
+
 def get_lights_from_effect_obj(obj: bpy.types.Object, context: bpy.types.Context | None = None) -> dict:
     """Return lights that affect ``obj`` via light/shadow linking."""
     if obj is None:
@@ -622,45 +993,9 @@ def get_lights_from_effect_obj(obj: bpy.types.Object, context: bpy.types.Context
     obj = resolve_original_id(obj)
     if context is not None:
         _ensure_linking_ui_cache(context)
-    cache_key = obj.as_pointer()
-    cached = _cached_object_light_states.get(cache_key)
-    if cached is not None:
-        return cached
-
-    light_state = {}
-    if _linking_ui_cache_key is not None:
-        lights = _cached_linking_lights
-    elif context is not None:
-        lights = context.scene.objects
-    else:
-        return light_state
-
-    for light_obj in lights:
-        if not is_tool_light_source(light_obj, context) or not hasattr(light_obj, 'light_linking'):
-            continue
-        linking = light_obj.light_linking
-        if not linking.receiver_collection and not linking.blocker_collection:
-            continue
-
-        receiver_on = (
-            is_object_affected_in_channel(light_obj, obj, CollectionType.RECEIVER)
-            and not is_internal_world_dome_link(light_obj, obj, CollectionType.RECEIVER)
-        )
-        blocker_on = (
-            is_object_affected_in_channel(light_obj, obj, CollectionType.BLOCKER)
-            and not is_internal_world_dome_link(light_obj, obj, CollectionType.BLOCKER)
-        )
-        if not receiver_on and not blocker_on:
-            continue
-
-        light_state[light_obj] = {
-            CollectionType.RECEIVER: True if receiver_on else None,
-            CollectionType.BLOCKER: True if blocker_on else None,
-        }
-
-    if _linking_ui_cache_key is not None:
-        _cached_object_light_states[cache_key] = light_state
-    return light_state
+    if _linking_ui_cache_key is None:
+        return {}
+    return _cached_object_light_states.get(obj.as_pointer(), {})
 
 
 # Keep the overlay-facing name as an alias of the shared query.
@@ -673,6 +1008,17 @@ def get_object_link_light_count(obj: bpy.types.Object, context: bpy.types.Contex
     return len(get_lights_from_effect_obj(obj, context))
 
 
+def get_object_link_light_counts(context: bpy.types.Context) -> dict[int, int]:
+    """Object pointer -> number of linking lights, for the current linking UI cache generation."""
+    global _cached_object_light_counts
+    _ensure_linking_ui_cache(context)
+    if _cached_object_light_counts is None:
+        _cached_object_light_counts = {
+            pointer: len(states) for pointer, states in _cached_object_light_states.items()
+        }
+    return _cached_object_light_counts
+
+
 def get_filtered_tool_objects(context: bpy.types.Context) -> list[bpy.types.Object]:
     from ..filter import filter_objects
     return [obj for obj in filter_objects(context) if is_linkable_object(obj)]
@@ -733,11 +1079,14 @@ def select_tool_object(context: bpy.types.Context, obj: bpy.types.Object) -> Non
             selected.select_set(False)
         view_layer.objects.active = obj
         obj.select_set(True)
+    from ..filter import light_source_registry_index
     objects = context.scene.objects[:]
     scene_props = context.scene.light_helper_property
     if obj in objects:
-        scene_props.active_object_index = objects.index(obj)
         scene_props.active_linked_object_index = objects.index(obj)
+    index = light_source_registry_index(context.scene, obj)
+    if index >= 0:
+        scene_props.active_object_index = index
     if is_in_view_layer(context, obj):
         view_selected(context)
 
@@ -759,6 +1108,9 @@ _view_layer_collections_cache = frozenset()
 _cached_linking_lights = ()
 _cached_linked_objects = ()
 _cached_object_light_states = {}
+_cached_object_light_counts = None
+# Light pointer -> linked item count; cleared with every generation bump.
+_cached_light_link_item_counts = {}
 _linking_ui_cache_key = None
 _linking_ui_cache_generation = 0
 
@@ -782,16 +1134,24 @@ def invalidate_linking_ui_cache() -> None:
     global _cached_linking_lights
     global _cached_linked_objects
     global _cached_object_light_states
+    global _cached_object_light_counts
     global _linking_ui_cache_key
     global _linking_ui_cache_generation
     _view_layer_collections_cache = frozenset()
     _cached_linking_lights = ()
     _cached_linked_objects = ()
     _cached_object_light_states = {}
+    _cached_object_light_counts = None
+    _cached_light_link_item_counts.clear()
+    _collection_tree_cache.clear()
     _linking_ui_cache_key = None
     _linking_ui_cache_generation += 1
 
 
+def get_linking_ui_cache_generation() -> int:
+    return _linking_ui_cache_generation
+
+
 def _linking_context_cache_key(context: bpy.types.Context) -> tuple:
     return (
         context.scene.as_pointer(),
@@ -802,11 +1162,37 @@ def _linking_context_cache_key(context: bpy.types.Context) -> tuple:
     )
 
 
+def _build_object_light_index(lights) -> dict:
+    """Map object pointers to the lights affecting them in a single pass over all channels."""
+    index = {}
+    for light_obj in lights:
+        linking = light_obj.light_linking
+        for coll_type, coll in (
+            (CollectionType.RECEIVER, linking.receiver_collection),
+            (CollectionType.BLOCKER, linking.blocker_collection),
+        ):
+            if coll is None:
+                continue
+            members = list(coll.objects)
+            for child in coll.children:
+                members.extend(collection_tree_objects(child))
+            for obj in members:
+                if is_internal_world_dome_link(light_obj, obj, coll_type):
+                    continue
+                state = index.setdefault(obj.as_pointer(), {}).setdefault(
+                    light_obj,
+                    {CollectionType.RECEIVER: None, CollectionType.BLOCKER: None},
+                )
+                state[coll_type] = True
+    return index
+
+
 def _ensure_linking_ui_cache(context: bpy.types.Context) -> None:
     global _view_layer_collections_cache
     global _cached_linking_lights
     global _cached_linked_objects
     global _cached_object_light_states
+    global _cached_object_light_counts
     global _linking_ui_cache_key
     if context is None or context.scene is None or context.view_layer is None:
         return
@@ -836,7 +1222,8 @@ def _ensure_linking_ui_cache(context: bpy.types.Context) -> None:
         context,
         _cached_linking_lights,
     )
-    _cached_object_light_states = {}
+    _cached_object_light_states = _build_object_light_index(_cached_linking_lights)
+    _cached_object_light_counts = None
     _linking_ui_cache_key = cache_key
 
 
@@ -859,6 +1246,20 @@ def get_view_layer_collections_cache():
     return _view_layer_collections_cache
 
 
+# Emission results per node-tree pointer, then search depth. Material trees and node
+# groups share the table, so a group is summarized once for every material using it.
+_emission_tree_cache: dict[int, dict[int, bool]] = {}
+
+
+def invalidate_emission_cache(pointers=None) -> None:
+    """Drop cached emission results, either for the given node-tree pointers or all of them."""
+    if pointers is None:
+        _emission_tree_cache.clear()
+        return
+    for pointer in pointers:
+        _emission_tree_cache.pop(pointer, None)
+
+
 def check_material_including_emission(
         obj: bpy.types.Object,
         check_depth=5,
@@ -869,39 +1270,11 @@ def check_material_including_emission(
         if cache_key in cache:
             return cache[cache_key]
 
-    def node_tree_search(node: bpy.types.Node, depth=0):
-        if depth > check_depth:
-            return None
-        for input_point in node.inputs:
-            for link in input_point.links:
-                from_node = link.from_node
-                if from_node.type in {"ADD_SHADER", "MIX_SHADER"}:
-                    find = node_tree_search(from_node, depth + 1)
-                    if find:
-                        return find
-                elif from_node.type == "EMISSION":
-                    return True
-                elif from_node.type == "BSDF_PRINCIPLED":
-                    for i in from_node.inputs:
-                        if i.identifier == "Emission Strength" and i.default_value > 0:
-                            return True
-                elif from_node.type == "GROUP":
-                    group_out_node = find_material_output_node(from_node.node_tree.nodes)
-                    if group_out_node:
-                        find = node_tree_search(group_out_node) is not None
-                        if find:
-                            return find
-                else:
-                    find = node_tree_search(link.from_node, depth + 1)
-                    if find:
-                        return find
-
     result = False
     for material in obj.material_slots:
         mat = material.material
-        if mat and mat.use_nodes:
-            out_node = find_material_output_node(mat.node_tree.nodes)
-            if out_node and node_tree_search(out_node):
+        if mat and mat.use_nodes and mat.node_tree is not None:
+            if node_tree_has_emission(mat.node_tree, check_depth):
                 result = True
                 break
     if cache is not None:
@@ -909,6 +1282,58 @@ def check_material_including_emission(
     return result
 
 
+def node_tree_has_emission(node_tree: bpy.types.NodeTree, check_depth=5) -> bool:
+    """Whether the active output of a material tree or node group is fed by emission."""
+    pointer = node_tree.as_pointer()
+    results = _emission_tree_cache.get(pointer)
+    if results is None:
+        results = _emission_tree_cache[pointer] = {}
+    elif check_depth in results:
+        return results[check_depth]
+
+    from ..handlers import ensure_filter_cache_invalidation_handler
+    ensure_filter_cache_invalidation_handler()
+    out_node = find_material_output_node(node_tree.nodes)
+    result = out_node is not None and _node_search_emission(out_node, check_depth)
+    results[check_depth] = result
+    return result
+
+
+def _node_search_emission(out_node: bpy.types.Node, check_depth) -> bool:
+    """Breadth-first search upstream of ``out_node``, expanding each node at most once.
+
+    A node is first reached at its shortest distance from the output, so this matches a
+    depth-limited walk over every path without re-exploring shared or diamond branches.
+    """
+    visited = {out_node.as_pointer()}
+    frontier = [out_node]
+    for _depth in range(check_depth + 1):
+        next_frontier = []
+        for node in frontier:
+            for input_point in node.inputs:
+                for link in input_point.links:
+                    from_node = link.from_node
+                    if from_node.type == "EMISSION":
+                        return True
+                    elif from_node.type == "BSDF_PRINCIPLED":
+                        for i in from_node.inputs:
+                            if i.identifier == "Emission Strength" and i.default_value > 0:
+                                return True
+                    elif from_node.type == "GROUP":
+                        # Groups restart the depth budget, so their result only depends on the group tree.
+                        if from_node.node_tree is not None and node_tree_has_emission(from_node.node_tree, check_depth):
+                            return True
+                    else:
+                        pointer = from_node.as_pointer()
+                        if pointer not in visited:
+                            visited.add(pointer)
+                            next_frontier.append(from_node)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return False
+
+
 def find_material_output_node(nodes):
     for node in nodes:
         if node.type in ("OUTPUT_MATERIAL", "GROUP_OUTPUT") and node.is_active_output:
@@ -969,9 +1394,11 @@ def has_shared_linking_collections(light: bpy.types.Object) -> bool:
     if not hasattr(light, "light_linking"):
         return False
     linking = light.light_linking
-    receiver = linking.receiver_collection
-    blocker = linking.blocker_collection
-    return (receiver is not None and receiver.users > 1) or (blocker is not None and blocker.users > 1)
+    return any(
+        coll is not None and coll.users > 1
+        and any(owner != light for owner in get_linking_collection_owners(coll))
+        for coll in (linking.receiver_collection, linking.blocker_collection)
+    )
 
 
 def split_shared_linking_collection(light: bpy.types.Object, coll_type: CollectionType) -> bool:
@@ -988,6 +1415,7 @@ def split_shared_linking_collection(light: bpy.types.Object, coll_type: Collecti
         linking.receiver_collection = new_coll
     else:
         linking.blocker_collection = new_coll
+    update_linking_collection_owners((light,))
     apply_linking_mode_to_light(light)
     return True
 
@@ -1014,12 +1442,8 @@ def find_duplicate_source_object(obj: bpy.types.Object) -> bpy.types.Object | No
         for coll in (linking.receiver_collection, linking.blocker_collection):
             if coll is None or coll.users <= 1:
                 continue
-            for other in bpy.data.objects:
-                if other == obj or other.type != 'LIGHT' or not hasattr(other, "light_linking"):
-                    continue
-                other_linking = other.light_linking
-                if (other_linking.receiver_collection == coll
-                        or other_linking.blocker_collection == coll):
+            for other in get_linking_collection_owners(coll):
+                if other != obj and other.type == 'LIGHT':
                     return other
 
     return None
@@ -1052,16 +1476,17 @@ def inherit_light_linking_from_object(
             and hasattr(source, "light_helper_property")):
         target.light_helper_property.linking_mode = source.light_helper_property.linking_mode
 
-    for light_obj in scene.objects:
-        if not hasattr(light_obj, "light_linking"):
-            continue
-        linking = light_obj.light_linking
-        if not linking.receiver_collection and not linking.blocker_collection:
-            continue
-        for coll_type in (CollectionType.RECEIVER, CollectionType.BLOCKER):
-            if is_item_in_channel(light_obj, source, coll_type):
-                link_item_to_channel(light_obj, target, coll_type, True, context)
-                changed = True
+    with linking_batch(context):
+        for light_obj in scene.objects:
+            if not hasattr(light_obj, "light_linking"):
+                continue
+            linking = light_obj.light_linking
+            if not linking.receiver_collection and not linking.blocker_collection:
+                continue
+            for coll_type in (CollectionType.RECEIVER, CollectionType.BLOCKER):
+                if is_item_in_channel(light_obj, source, coll_type):
+                    link_item_to_channel(light_obj, target, coll_type, True, context)
+                    changed = True
     return changed
 
 
@@ -1077,16 +1502,17 @@ def prime_existing_duplicate_objects(scene: bpy.types.Scene,
                                    context: bpy.types.Context | None = None) -> None:
     """Mark scene duplicates as handled so later source links do not cascade."""
     ctx = context if context is not None else bpy.context
-    for obj in scene.objects:
-        if is_duplicate_handled(obj) or obj.type == 'LIGHT':
-            continue
-        source = find_duplicate_source_object(obj)
-        if source is None:
-            continue
-        if (is_object_linked_by_any_light(source, ctx)
-                and not is_object_linked_by_any_light(obj, ctx)):
-            inherit_light_linking_from_object(obj, source, ctx)
-        mark_duplicate_handled(obj)
+    with linking_batch(ctx):
+        for obj in scene.objects:
+            if is_duplicate_handled(obj) or obj.type == 'LIGHT':
+                continue
+            source = find_duplicate_source_object(obj)
+            if source is None:
+                continue
+            if (is_object_linked_by_any_light(source, ctx)
+                    and not is_object_linked_by_any_light(obj, ctx)):
+                inherit_light_linking_from_object(obj, source, ctx)
+            mark_duplicate_handled(obj)
 
 
 def process_duplicated_object(obj: bpy.types.Object, context: bpy.types.Context | None = None) -> bool:
@@ -1121,6 +1547,82 @@ def process_duplicated_object(obj: bpy.types.Object, context: bpy.types.Context
     return changed
 
 
+def _scene_linking_channels(scene: bpy.types.Scene) -> list[tuple]:
+    """``(light, coll_type, member pointers)`` for every linking channel used in ``scene``."""
+    lights = {}
+    for owners in list(_ensure_linking_collection_owners().values()):
+        for pointer, obj in list(owners.items()):
+            if pointer in lights:
+                continue
+            try:
+                if scene.objects.get(obj.name) == obj:
+                    lights[pointer] = obj
+            except ReferenceError:
+                continue
+    channels = []
+    for light in lights.values():
+        for coll_type in (CollectionType.RECEIVER, CollectionType.BLOCKER):
+            coll = get_linking_coll(light, coll_type)
+            if coll is not None:
+                channels.append((light, coll_type, _collection_membership(coll).objects))
+    return channels
+
+
+def process_duplicated_objects(objects, context: bpy.types.Context | None = None) -> list[bpy.types.Object]:
+    """Batch form of ``process_duplicated_object`` for everything one depsgraph update added.
+
+    Non-light duplicates inherit their sources' channels from a single membership
+    index; the new links are grouped per light and channel and applied in bulk
+    inside one ``linking_batch``. Returns the objects that changed.
+    """
+    ctx = context if context is not None else bpy.context
+    changed = []
+    pending = []
+    for obj in objects:
+        obj = resolve_original_id(obj)
+        if obj is None or not is_original_id(obj) or is_duplicate_handled(obj):
+            continue
+        if obj.type == 'LIGHT':
+            if process_duplicated_object(obj, ctx):
+                changed.append(obj)
+            continue
+        source = find_duplicate_source_object(obj)
+        if source is None:
+            continue
+        track_duplicate_source(source, obj)
+        pending.append((obj, resolve_original_id(source)))
+    if not pending or ctx.scene is None:
+        return changed
+
+    channels = _scene_linking_channels(ctx.scene)
+    # Channel index -> new items. Source channels are resolved once per source, and a
+    # duplicate of a duplicate also inherits what its source gained earlier in this pass.
+    groups = {}
+    inherited = {}
+    source_channels = {}
+    for obj, source in pending:
+        source_pointer = source.as_pointer()
+        indices = source_channels.get(source_pointer)
+        if indices is None:
+            indices = inherited.get(source_pointer, set()).union(
+                i for i, (_light, _coll_type, members) in enumerate(channels)
+                if source_pointer in members
+            )
+            source_channels[source_pointer] = indices
+        inherited[obj.as_pointer()] = indices
+        for i in indices:
+            groups.setdefault(i, []).append(obj)
+        if indices:
+            changed.append(obj)
+        mark_duplicate_handled(obj)
+
+    with linking_batch(ctx):
+        for i, items in groups.items():
+            light, coll_type, _members = channels[i]
+            link_items_to_channels(light, items, (coll_type,), True, ctx)
+    return changed
+
+
 def fix_all_shared_light_linking(scene: bpy.types.Scene) -> list[bpy.types.Object]:
     fixed = []
     for obj in scene.objects:
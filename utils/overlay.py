@@ -5,6 +5,7 @@ from __future__ import annotations
 import bpy
 import blf
 import gpu
+import numpy as np
 from bpy_extras import view3d_utils
 from gpu_extras.batch import batch_for_shader
 from mathutils import Vector
@@ -15,6 +16,7 @@ from . import (
     get_linking_mode,
     get_pref,
 )
+from .cache import LRUCache
 
 _draw_handler_3d = None
 _draw_handler_hud = None
@@ -30,6 +32,13 @@ _bbox_edges = (
     (4, 5), (5, 6), (6, 7), (7, 4),
     (0, 4), (1, 5), (2, 6), (3, 7),
 )
+_BBOX_EDGE_INDEX = np.array(_bbox_edges, dtype=np.intp).ravel()
+# Corner order of an axis-aligned box, as (use max x, use max y, use max z) per corner.
+_AABB_CORNER_SELECT = np.array((
+    (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+    (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+), dtype=bool)
+_BBOX_OBJECT_TYPES = {"MESH", "CURVE", "SURFACE", "META", "FONT", "GPENCIL", "GREASEPENCIL"}
 
 COLOR_LINE_SHADOW = (0.3, 0.6, 1.0, 0.8)
 COLOR_LINE_NONE = (0.6, 0.6, 0.6, 0.5)
@@ -51,6 +60,8 @@ OVERLAY_MODE_OFF = 'OFF'
 OVERLAY_MODE_SELECTED = 'SELECTED'
 OVERLAY_MODE_ALL = 'ALL'
 INACTIVE_LINK_ALPHA_SCALE = 0.1
+# Targets of one subject whose centers share a screen cell of this size draw as one bundle.
+LOD_CELL_PIXELS = 12.0
 
 _polyline_shader = None
 
@@ -62,18 +73,17 @@ class LinkDrawTarget:
         "blocker",
         "is_collection",
         "name",
-        "center",
-        "corners",
+        "index",
     )
 
-    def __init__(self, item, receiver, blocker, is_collection, name, center=None, corners=None):
+    def __init__(self, item, receiver, blocker, is_collection, name):
         self.item = item
         self.receiver = receiver
         self.blocker = blocker
         self.is_collection = is_collection
         self.name = name
-        self.center = center
-        self.corners = corners
+        # Row of the target's box in the owning ``OverlayGeometry``.
+        self.index = -1
 
 
 class LinkDrawGroup:
@@ -85,8 +95,38 @@ class LinkDrawGroup:
         self.is_active = is_active
 
 
+class OverlayGeometry:
+    """World-space boxes of every distinct overlay target, as contiguous float32 arrays."""
+    __slots__ = ("items", "corners", "centers", "object_rows")
+
+    def __init__(self, items: list, corners: np.ndarray, centers: np.ndarray, object_rows: dict):
+        # One representative LinkDrawTarget per row.
+        self.items = items
+        self.corners = corners
+        self.centers = centers
+        # Object pointer -> rows whose box is computed from that object.
+        self.object_rows = object_rows
+
+
+_EMPTY_GEOMETRY = OverlayGeometry([], np.empty((0, 8, 3), np.float32), np.empty((0, 3), np.float32), {})
+
+
 class LinkOverlayCache:
-    __slots__ = ("overlay_mode", "subject_mode", "light", "object", "groups", "outlines_hidden", "engine", "invalid")
+    __slots__ = (
+        "overlay_mode",
+        "subject_mode",
+        "light",
+        "object",
+        "groups",
+        "outlines_hidden",
+        "engine",
+        "invalid",
+        "geometry",
+        "subject_groups",
+        "collection_pointers",
+        "draw_data",
+        "batches",
+    )
 
     def __init__(self):
         self.overlay_mode = OVERLAY_MODE_SELECTED
@@ -97,12 +137,24 @@ class LinkOverlayCache:
         self.outlines_hidden = False
         self.engine = None
         self.invalid = True
+        self.geometry = _EMPTY_GEOMETRY
+        # Subject pointer -> group indices, and the collections whose edits need a full refresh.
+        self.subject_groups = {}
+        self.collection_pointers = frozenset()
+        # Per-target draw arrays built from ``groups``; None until the next draw rebuilds them.
+        self.draw_data = None
+        # Region pointer -> (view key, GPU batches); ALL mode re-culls when the view changes.
+        self.batches = {}
 
     def invalidate(self):
         self.invalid = True
+        self.draw_data = None
 
 
 _cache = LinkOverlayCache()
+# Recently built groups per subject, so cycling between subjects or overlay modes
+# reuses them. Any linking, transform or collection change clears it.
+_overlay_groups_cache = LRUCache("overlay_groups", 8)
 
 
 def notify_linking_changed(context: bpy.types.Context | None = None) -> None:
@@ -296,10 +348,14 @@ def mouse_over_hud(context: bpy.types.Context, event) -> bool:
 
 
 def invalidate_overlay_cache():
+    _overlay_groups_cache.clear()
     _cache.invalidate()
     _cache.light = None
     _cache.object = None
     _cache.groups = []
+    _cache.geometry = _EMPTY_GEOMETRY
+    _cache.subject_groups = {}
+    _cache.collection_pointers = frozenset()
     _cache.outlines_hidden = False
 
 
@@ -339,46 +395,100 @@ def _subject_cache_key(subject_mode: str, subject: bpy.types.Object | None) -> t
     return subject_mode, subject.name
 
 
-def _world_bbox_from_object(obj: bpy.types.Object) -> tuple[Vector, list[Vector]]:
-    matrix = obj.matrix_world
-    corners = [matrix @ Vector(corner) for corner in obj.bound_box]
-    center = sum(corners, Vector()) / 8.0
-    return center, corners
+def _object_world_boxes(objects) -> np.ndarray:
+    """World-space bound_box corners of ``objects`` as an (N, 8, 3) float32 array."""
+    if not objects:
+        return np.empty((0, 8, 3), np.float32)
+    matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float32)
+    local = np.array([obj.bound_box for obj in objects], dtype=np.float32)
+    return local @ matrices[:, :3, :3].transpose(0, 2, 1) + matrices[:, None, :3, 3]
 
 
-def _world_bbox_from_collection(coll: bpy.types.Collection) -> tuple[Vector | None, list[Vector] | None]:
-    corners_all = []
-    for obj in coll.objects:
-        if obj.hide_viewport or obj.hide_get():
-            continue
-        if obj.type not in {"MESH", "CURVE", "SURFACE", "META", "FONT", "GPENCIL", "GREASEPENCIL"}:
-            continue
-        _, corners = _world_bbox_from_object(obj)
-        corners_all.extend(corners)
-    if not corners_all:
-        return None, None
-    min_co = Vector((
-        min(c.x for c in corners_all),
-        min(c.y for c in corners_all),
-        min(c.z for c in corners_all),
-    ))
-    max_co = Vector((
-        max(c.x for c in corners_all),
-        max(c.y for c in corners_all),
-        max(c.z for c in corners_all),
-    ))
-    corners = [
-        Vector((min_co.x, min_co.y, min_co.z)),
-        Vector((max_co.x, min_co.y, min_co.z)),
-        Vector((max_co.x, max_co.y, min_co.z)),
-        Vector((min_co.x, max_co.y, min_co.z)),
-        Vector((min_co.x, min_co.y, max_co.z)),
-        Vector((max_co.x, min_co.y, max_co.z)),
-        Vector((max_co.x, max_co.y, max_co.z)),
-        Vector((min_co.x, max_co.y, max_co.z)),
+def _collection_bbox_objects(coll: bpy.types.Collection) -> list[bpy.types.Object]:
+    return [
+        obj for obj in coll.objects
+        if not (obj.hide_viewport or obj.hide_get()) and obj.type in _BBOX_OBJECT_TYPES
+    ]
+
+
+def _target_boxes(items: list[LinkDrawTarget]) -> tuple[np.ndarray, np.ndarray, list] | None:
+    """Corners and centers of each target's box, plus the objects each box was computed from.
+
+    Returns None when a collection target no longer has any visible member to bound.
+    """
+    members = [
+        _collection_bbox_objects(target.item) if target.is_collection else (target.item,)
+        for target in items
     ]
-    center = (min_co + max_co) / 2.0
-    return center, corners
+    if not all(members):
+        return None
+    sources = [obj for row_members in members for obj in row_members]
+    world = _object_world_boxes(sources)
+    starts = np.cumsum([0] + [len(row_members) for row_members in members[:-1]]) * 8
+
+    # Collections are drawn as the axis-aligned union of their member boxes.
+    points = world.reshape(-1, 3)
+    mins = np.minimum.reduceat(points, starts)
+    maxs = np.maximum.reduceat(points, starts)
+    corners = np.where(_AABB_CORNER_SELECT, maxs[:, None, :], mins[:, None, :])
+    centers = (mins + maxs) * 0.5
+
+    object_rows = np.array([not target.is_collection for target in items])
+    first_source = starts[object_rows] // 8
+    corners[object_rows] = world[first_source]
+    centers[object_rows] = world[first_source].mean(axis=1)
+    return corners.astype(np.float32), centers.astype(np.float32), members
+
+
+def _build_overlay_geometry(groups: list[LinkDrawGroup]) -> OverlayGeometry:
+    """Fill one box row per distinct target item and point every target at its row."""
+    rows = {}
+    items = []
+    for group in groups:
+        for target in group.targets:
+            pointer = target.item.as_pointer()
+            row = rows.get(pointer)
+            if row is None:
+                row = rows[pointer] = len(items)
+                items.append(target)
+            target.index = row
+    if not items:
+        return _EMPTY_GEOMETRY
+
+    boxes = _target_boxes(items)
+    if boxes is None:
+        return _EMPTY_GEOMETRY
+    corners, centers, members = boxes
+    object_rows = {}
+    for row, row_members in enumerate(members):
+        for obj in row_members:
+            object_rows.setdefault(obj.as_pointer(), []).append(row)
+    return OverlayGeometry(items, corners, centers, object_rows)
+
+
+def _update_moved_targets(moved_rows: set[int], moved_subjects: set[int]) -> bool:
+    """Recompute only the boxes and subject positions touched by transform updates.
+
+    Returns False when a box can no longer be computed and the groups need a full refresh.
+    """
+    geometry = _cache.geometry
+    if moved_rows:
+        rows = sorted(moved_rows)
+        boxes = _target_boxes([geometry.items[row] for row in rows])
+        if boxes is None:
+            return False
+        corners, centers, _members = boxes
+        geometry.corners[rows] = corners
+        geometry.centers[rows] = centers
+    data = _cache.draw_data
+    if data is not None and moved_subjects:
+        for pointer in moved_subjects:
+            for group_index in _cache.subject_groups[pointer]:
+                subject = _cache.groups[group_index].subject
+                data.starts[data.groups == group_index] = tuple(subject.matrix_world.translation)
+        data.subject_edges, data.subject_colors = _subject_outline_data(_cache.subject_mode)
+    _cache.batches = {}
+    return True
 
 
 def _channel_color(receiver: bool, blocker: bool, both_color, light_color, shadow_color, none_color):
@@ -435,10 +545,6 @@ def _target_outline_colors(linking_mode: str):
     )
 
 
-def _target_world_bbox(target: LinkDrawTarget) -> tuple[Vector | None, list[Vector] | None]:
-    return target.center, target.corners
-
-
 def _build_targets_from_light(light: bpy.types.Object, max_outlines: int) -> tuple[list[LinkDrawTarget], bool]:
     items_state = get_all_light_effect_items_state(light)
     targets = []
@@ -448,19 +554,13 @@ def _build_targets_from_light(light: bpy.types.Object, max_outlines: int) -> tup
         if isinstance(item, bpy.types.Object):
             if item.hide_viewport or item.hide_get():
                 continue
-            center, corners = _world_bbox_from_object(item)
-            targets.append(LinkDrawTarget(
-                item, receiver, blocker, False, item.name, center, corners,
-            ))
+            targets.append(LinkDrawTarget(item, receiver, blocker, False, item.name))
         elif isinstance(item, bpy.types.Collection):
             if item.hide_viewport:
                 continue
-            center, corners = _world_bbox_from_collection(item)
-            if center is None:
+            if not _collection_bbox_objects(item):
                 continue
-            targets.append(LinkDrawTarget(
-                item, receiver, blocker, True, item.name, center, corners,
-            ))
+            targets.append(LinkDrawTarget(item, receiver, blocker, True, item.name))
     outlines_hidden = max_outlines >= 0 and len(targets) > max_outlines
     return targets, outlines_hidden
 
@@ -475,10 +575,7 @@ def _build_targets_from_object(obj: bpy.types.Object, context: bpy.types.Context
             continue
         receiver = state[CollectionType.RECEIVER] is True
         blocker = state[CollectionType.BLOCKER] is True
-        center, corners = _world_bbox_from_object(light_obj)
-        targets.append(LinkDrawTarget(
-            light_obj, receiver, blocker, False, light_obj.name, center, corners,
-        ))
+        targets.append(LinkDrawTarget(light_obj, receiver, blocker, False, light_obj.name))
     outlines_hidden = max_outlines >= 0 and len(targets) > max_outlines
     return targets, outlines_hidden
 
@@ -508,7 +605,7 @@ def _build_all_light_groups(context: bpy.types.Context, active_light: bpy.types.
 
 def _build_all_object_groups(context: bpy.types.Context, active_obj: bpy.types.Object | None,
                              max_outlines: int) -> tuple[list[LinkDrawGroup], bool]:
-    from . import is_linkable_object, resolve_original_id
+    from . import collection_tree_objects, is_linkable_object, resolve_original_id
 
     active_obj = resolve_original_id(active_obj)
     object_states = {}
@@ -521,7 +618,7 @@ def _build_all_object_groups(context: bpy.types.Context, active_obj: bpy.types.O
             if isinstance(item, bpy.types.Object):
                 candidates = (item,)
             elif isinstance(item, bpy.types.Collection):
-                candidates = item.all_objects
+                candidates = collection_tree_objects(item)
             else:
                 continue
             for obj in candidates:
@@ -544,15 +641,12 @@ def _build_all_object_groups(context: bpy.types.Context, active_obj: bpy.types.O
     for obj, light_states in object_states.items():
         targets = []
         for light, state in light_states.items():
-            center, corners = _world_bbox_from_object(light)
             targets.append(LinkDrawTarget(
                 light,
                 state[CollectionType.RECEIVER] is True,
                 state[CollectionType.BLOCKER] is True,
                 False,
                 light.name,
-                center,
-                corners,
             ))
         is_active = active_obj is not None and obj == active_obj
         groups.append(LinkDrawGroup(obj, targets, is_active))
@@ -562,18 +656,6 @@ def _build_all_object_groups(context: bpy.types.Context, active_obj: bpy.types.O
     return groups, outlines_hidden
 
 
-def _draw_subject_outline(context: bpy.types.Context, subject: bpy.types.Object, alpha_scale: float = 1.0):
-    if subject is None:
-        return
-    _center, corners = _world_bbox_from_object(subject)
-    edge_coords = []
-    for i0, i1 in _bbox_edges:
-        edge_coords.append(corners[i0])
-        edge_coords.append(corners[i1])
-    color = _scale_color_alpha(COLOR_SUBJECT_OUTLINE, alpha_scale)
-    _draw_lines_batch(context, edge_coords, color, width=1.8)
-
-
 def refresh_overlay_cache(context: bpy.types.Context):
     from . import is_tool_light_source, refresh_drop_poll_context
 
@@ -593,46 +675,87 @@ def refresh_overlay_cache(context: bpy.types.Context):
         _cache.groups = []
         _cache.outlines_hidden = False
         _cache.invalid = False
+        _cache.geometry = _EMPTY_GEOMETRY
+        _cache.subject_groups = {}
+        _cache.collection_pointers = frozenset()
+        _cache.draw_data = None
         return
 
-    groups: list[LinkDrawGroup] = []
-    outlines_hidden = False
-
     if subject_mode == 'OBJECT':
         refresh_drop_poll_context(context)
-        active_obj = wm_props.linking_tool_object
-        if overlay_mode == OVERLAY_MODE_SELECTED:
-            if active_obj is not None:
-                targets, outlines_hidden = _build_targets_from_object(active_obj, context, max_outlines)
-                groups = [LinkDrawGroup(active_obj, targets, True)]
-        else:
-            groups, outlines_hidden = _build_all_object_groups(context, active_obj, max_outlines)
+        subject = wm_props.linking_tool_object
         _cache.subject_mode = 'OBJECT'
         _cache.light = None
-        _cache.object = active_obj
+        _cache.object = subject
     else:
-        active_light = wm_props.linking_tool_light
-        if active_light is not None and not is_tool_light_source(active_light, context):
-            active_light = None
-        if overlay_mode == OVERLAY_MODE_SELECTED:
-            if active_light is not None:
-                targets, outlines_hidden = _build_targets_from_light(active_light, max_outlines)
-                groups = [LinkDrawGroup(active_light, targets, True)]
-        else:
-            groups, outlines_hidden = _build_all_light_groups(context, active_light, max_outlines)
+        subject = wm_props.linking_tool_light
+        if subject is not None and not is_tool_light_source(subject, context):
+            subject = None
         _cache.subject_mode = 'LIGHT'
-        _cache.light = active_light
+        _cache.light = subject
         _cache.object = None
 
+    key = (
+        overlay_mode,
+        _cache.subject_mode,
+        _subject_cache_key(_cache.subject_mode, subject)[1],
+        _cache.engine,
+        max_outlines,
+    )
+    built = _overlay_groups_cache.get(key)
+    if built is None:
+        groups, outlines_hidden = _build_overlay_groups(
+            context, overlay_mode, _cache.subject_mode, subject, max_outlines)
+        built = (groups, outlines_hidden, _build_overlay_geometry(groups))
+        _overlay_groups_cache[key] = built
+    groups, outlines_hidden, geometry = built
+
     _cache.groups = groups
     _cache.outlines_hidden = outlines_hidden
+    _cache.geometry = geometry
+    _cache.subject_groups, _cache.collection_pointers = _overlay_update_indices(groups)
     _cache.invalid = False
+    _cache.draw_data = None
+
+
+def _overlay_update_indices(groups: list[LinkDrawGroup]) -> tuple[dict, frozenset]:
+    subject_groups = {}
+    collection_pointers = set()
+    for group_index, group in enumerate(groups):
+        subject = group.subject
+        if subject is not None:
+            subject_groups.setdefault(subject.as_pointer(), []).append(group_index)
+            if hasattr(subject, "light_linking"):
+                linking = subject.light_linking
+                for coll in (linking.receiver_collection, linking.blocker_collection):
+                    if coll is not None:
+                        collection_pointers.add(coll.as_pointer())
+        for target in group.targets:
+            if target.is_collection:
+                collection_pointers.add(target.item.as_pointer())
+    return subject_groups, frozenset(collection_pointers)
+
+
+def _build_overlay_groups(context, overlay_mode, subject_mode, subject, max_outlines):
+    if subject_mode == 'OBJECT':
+        if overlay_mode != OVERLAY_MODE_SELECTED:
+            return _build_all_object_groups(context, subject, max_outlines)
+        if subject is None:
+            return [], False
+        targets, outlines_hidden = _build_targets_from_object(subject, context, max_outlines)
+        return [LinkDrawGroup(subject, targets, True)], outlines_hidden
+    if overlay_mode != OVERLAY_MODE_SELECTED:
+        return _build_all_light_groups(context, subject, max_outlines)
+    if subject is None:
+        return [], False
+    targets, outlines_hidden = _build_targets_from_light(subject, max_outlines)
+    return [LinkDrawGroup(subject, targets, True)], outlines_hidden
 
 
 def _get_polyline_shader():
     global _polyline_shader
     if _polyline_shader is None:
-        _polyline_shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        _polyline_shader = gpu.shader.from_builtin('POLYLINE_SMOOTH_COLOR')
     return _polyline_shader
 
 
@@ -644,16 +767,177 @@ def _viewport_size(context: bpy.types.Context) -> tuple[float, float]:
     return float(viewport[2]), float(viewport[3])
 
 
-def _draw_lines_batch(context: bpy.types.Context, coords, color, width=1.5):
-    if len(coords) < 2:
-        return
+class OverlayDrawData:
+    """Per-target line endpoints and colors of one overlay build, independent of the view."""
+    __slots__ = ("subject_edges", "subject_colors", "starts", "rows", "groups", "line_colors", "outline_colors")
+
+
+def _subject_outline_data(subject_mode: str) -> tuple[np.ndarray, np.ndarray]:
+    subject_edges = []
+    subject_colors = []
+    if subject_mode == 'OBJECT':
+        for group in _cache.groups:
+            if group.subject is None or not group.is_active:
+                continue
+            subject_edges.append(_object_world_boxes((group.subject,))[0, _BBOX_EDGE_INDEX])
+            subject_colors.append(COLOR_SUBJECT_OUTLINE)
+    if not subject_edges:
+        return np.empty((0, 3), np.float32), np.empty((0, 4), np.float32)
+    colors = np.repeat(np.array(subject_colors, np.float32), len(_BBOX_EDGE_INDEX), axis=0)
+    return np.concatenate(subject_edges), colors
+
+
+def _build_overlay_draw_data(context: bpy.types.Context, subject_mode: str) -> OverlayDrawData:
+    starts = []
+    rows = []
+    group_indices = []
+    line_colors = []
+    outline_colors = []
+
+    for group_index, group in enumerate(_cache.groups):
+        if group.subject is None:
+            continue
+        alpha_scale = 1.0 if group.is_active else INACTIVE_LINK_ALPHA_SCALE
+        subject_pos = tuple(group.subject.matrix_world.translation)
+        for target in group.targets:
+            linking_mode = _resolve_target_linking_mode(group, target, subject_mode, context)
+            starts.append(subject_pos)
+            rows.append(target.index)
+            group_indices.append(group_index)
+            line_colors.append(_scale_color_alpha(_channel_color(
+                target.receiver, target.blocker,
+                *_target_line_colors(linking_mode),
+            ), alpha_scale))
+            outline_colors.append(_scale_color_alpha(_channel_color(
+                target.receiver, target.blocker,
+                *_target_outline_colors(linking_mode),
+            ), alpha_scale))
+
+    data = OverlayDrawData()
+    data.subject_edges, data.subject_colors = _subject_outline_data(subject_mode)
+    data.starts = np.array(starts, np.float32).reshape(-1, 3)
+    data.rows = np.array(rows, np.intp)
+    data.groups = np.array(group_indices, np.intp)
+    data.line_colors = np.array(line_colors, np.float32).reshape(-1, 4)
+    data.outline_colors = np.array(outline_colors, np.float32).reshape(-1, 4)
+    return data
+
+
+def _clip_coords(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    return points @ matrix[:, :3].T + matrix[:, 3]
+
+
+def _view_lod_targets(data: OverlayDrawData, geometry: OverlayGeometry, view) -> tuple:
+    """Cull targets outside the view frustum and bundle targets that share a screen cell.
+
+    Returns line starts, centers, box corners, line colors and outline colors per drawn line.
+    """
+    matrix, width, height = view
+    rows = data.rows
+    centers = geometry.centers[rows]
+    corners = geometry.corners[rows]
+
+    # A target is culled when its box and line start all lie outside one clip plane.
+    hull = np.concatenate((_clip_coords(corners, matrix), _clip_coords(data.starts, matrix)[:, None]), axis=1)
+    xyz = hull[..., :3]
+    w = hull[..., 3:]
+    outside = (xyz < -w).all(axis=1) | (xyz > w).all(axis=1)
+    visible = np.flatnonzero(~outside.any(axis=1))
+    if not len(visible):
+        return (
+            np.empty((0, 3), np.float32), np.empty((0, 3), np.float32), np.empty((0, 8, 3), np.float32),
+            np.empty((0, 4), np.float32), np.empty((0, 4), np.float32),
+        )
+    centers = centers[visible]
+    corners = corners[visible]
+
+    clip = _clip_coords(centers, matrix)
+    in_front = clip[:, 3] > 1e-6
+    ndc = clip[:, :2] / np.where(in_front, clip[:, 3], 1.0)[:, None]
+    cells = np.floor((ndc * 0.5 + 0.5) * (width, height) / LOD_CELL_PIXELS).astype(np.int64)
+    # Centers behind the eye have no meaningful screen cell and are never bundled.
+    behind = np.flatnonzero(~in_front)
+    cells[behind, 0] = -1 - behind
+    cells[behind, 1] = np.iinfo(np.int64).min
+
+    _colors, color_codes = np.unique(data.line_colors[visible], axis=0, return_inverse=True)
+    keys = np.column_stack((data.groups[visible], color_codes.ravel(), cells))
+    _keys, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    sizes = np.bincount(inverse, minlength=len(first))
+
+    bundle_centers = np.zeros((len(first), 3), np.float32)
+    np.add.at(bundle_centers, inverse, centers)
+    bundle_centers /= sizes[:, None]
+    mins = np.full((len(first), 3), np.inf, np.float32)
+    maxs = np.full((len(first), 3), -np.inf, np.float32)
+    np.minimum.at(mins, inverse, corners.min(axis=1))
+    np.maximum.at(maxs, inverse, corners.max(axis=1))
+    bundle_corners = np.where(_AABB_CORNER_SELECT, maxs[:, None, :], mins[:, None, :])
+    single = sizes == 1
+    bundle_corners[single] = corners[first[single]]
+
+    source = visible[first]
+    return (
+        data.starts[source], bundle_centers, bundle_corners,
+        data.line_colors[source], data.outline_colors[source],
+    )
+
+
+def _build_overlay_batches(data: OverlayDrawData, view=None) -> list:
+    """Merge every line and outline into one batch per line width, culled to ``view`` if given."""
+    if view is None:
+        rows = data.rows
+        starts, centers, corners = data.starts, _cache.geometry.centers[rows], _cache.geometry.corners[rows]
+        line_colors, outline_colors = data.line_colors, data.outline_colors
+    else:
+        starts, centers, corners, line_colors, outline_colors = _view_lod_targets(data, _cache.geometry, view)
+
+    edge_count = len(_BBOX_EDGE_INDEX)
+    batch_data = []
+    if len(data.subject_edges):
+        batch_data.append((data.subject_edges, data.subject_colors, 1.8))
+    if len(starts):
+        line_coords = np.empty((len(starts) * 2, 3), np.float32)
+        line_coords[0::2] = starts
+        line_coords[1::2] = centers
+        batch_data.append((line_coords, np.repeat(line_colors, 2, axis=0), 2.0))
+        if not _cache.outlines_hidden:
+            outline_coords = corners[:, _BBOX_EDGE_INDEX].reshape(-1, 3)
+            batch_data.append((outline_coords, np.repeat(outline_colors, edge_count, axis=0), 1.5))
+
     shader = _get_polyline_shader()
-    shader.bind()
-    shader.uniform_float("viewportSize", _viewport_size(context))
-    shader.uniform_float("lineWidth", width)
-    shader.uniform_float("color", color)
-    batch = batch_for_shader(shader, 'LINES', {"pos": coords})
-    batch.draw(shader)
+    return [
+        (batch_for_shader(shader, 'LINES', {"pos": coords, "color": colors}), width)
+        for coords, colors, width in batch_data
+    ]
+
+
+def _overlay_view(context: bpy.types.Context):
+    region = context.region
+    region_data = context.region_data
+    if region is None or region_data is None:
+        return None, None
+    matrix = np.array(region_data.perspective_matrix, np.float32)
+    view = (matrix, float(region.width), float(region.height))
+    return region.as_pointer(), view
+
+
+def _overlay_batches(context: bpy.types.Context, subject_mode: str) -> list:
+    if _cache.draw_data is None:
+        _cache.draw_data = _build_overlay_draw_data(context, subject_mode)
+        _cache.batches = {}
+    if _cache.overlay_mode != OVERLAY_MODE_ALL:
+        region_key, view, view_key = None, None, None
+    else:
+        region_key, view = _overlay_view(context)
+        view_key = None if view is None else (view[0].tobytes(), view[1], view[2])
+    cached = _cache.batches.get(region_key)
+    if cached is not None and cached[0] == view_key:
+        return cached[1]
+    batches = _build_overlay_batches(_cache.draw_data, view)
+    _cache.batches[region_key] = (view_key, batches)
+    return batches
 
 
 def _current_subject_key(context: bpy.types.Context) -> tuple:
@@ -693,50 +977,18 @@ def _draw_overlay_3d():
         if not _cache.groups:
             return
 
-        subject_mode = wm_props.linking_tool_subject_mode
+        batches = _overlay_batches(context, wm_props.linking_tool_subject_mode)
+        if not batches:
+            return
+
         gpu.state.blend_set('ALPHA')
         gpu.state.depth_test_set('LESS_EQUAL')
-
-        for group in _cache.groups:
-            if group.subject is None:
-                continue
-            alpha_scale = 1.0 if group.is_active else INACTIVE_LINK_ALPHA_SCALE
-            subject_pos = group.subject.matrix_world.translation.copy()
-
-            if subject_mode == 'OBJECT' and group.is_active:
-                _draw_subject_outline(context, group.subject, alpha_scale)
-
-            if not group.targets:
-                continue
-
-            for target in group.targets:
-                center, _corners = _target_world_bbox(target)
-                if center is None:
-                    continue
-                linking_mode = _resolve_target_linking_mode(group, target, subject_mode, context)
-                color = _channel_color(
-                    target.receiver, target.blocker,
-                    *_target_line_colors(linking_mode),
-                )
-                color = _scale_color_alpha(color, alpha_scale)
-                _draw_lines_batch(context, [subject_pos, center], color, width=2.0)
-
-            if not _cache.outlines_hidden:
-                for target in group.targets:
-                    _center, corners = _target_world_bbox(target)
-                    if corners is None:
-                        continue
-                    linking_mode = _resolve_target_linking_mode(group, target, subject_mode, context)
-                    color = _channel_color(
-                        target.receiver, target.blocker,
-                        *_target_outline_colors(linking_mode),
-                    )
-                    color = _scale_color_alpha(color, alpha_scale)
-                    edge_coords = []
-                    for i0, i1 in _bbox_edges:
-                        edge_coords.append(corners[i0])
-                        edge_coords.append(corners[i1])
-                    _draw_lines_batch(context, edge_coords, color, width=1.5)
+        shader = _get_polyline_shader()
+        shader.bind()
+        shader.uniform_float("viewportSize", _viewport_size(context))
+        for batch, width in batches:
+            shader.uniform_float("lineWidth", width)
+            batch.draw(shader)
     except (AttributeError, ReferenceError, RuntimeError, TypeError):
         invalidate_overlay_cache()
     finally:
@@ -795,82 +1047,42 @@ def _draw_overlay_hud_safe():
         invalidate_overlay_cache()
 
 
-def _collect_overlay_object_names() -> set[str]:
-    names = set()
-    for group in _cache.groups:
-        if group.subject is not None:
-            names.add(group.subject.name)
-        for target in group.targets:
-            if target.is_collection:
-                for obj in target.item.objects:
-                    names.add(obj.name)
-            elif isinstance(target.item, bpy.types.Object):
-                names.add(target.item.name)
-    return names
-
-
-def _collect_overlay_collection_names() -> set[str]:
-    names = set()
-    for group in _cache.groups:
-        if group.subject is not None and hasattr(group.subject, "light_linking"):
-            linking = group.subject.light_linking
-            if linking.receiver_collection is not None:
-                names.add(linking.receiver_collection.name)
-            if linking.blocker_collection is not None:
-                names.add(linking.blocker_collection.name)
-        for target in group.targets:
-            if target.is_collection:
-                names.add(target.item.name)
-    return names
-
-
-@bpy.app.handlers.persistent
-def _depsgraph_update_post(_scene, depsgraph: bpy.types.Depsgraph):
+def _depsgraph_update_post(_scene, summary):
     try:
         context = bpy.context
         if context is None or context.window_manager is None:
             return
+        if summary.objects or summary.scene_updated:
+            # Moved, hidden, added or removed objects change the pick grid.
+            invalidate_pick_index()
+
         wm_props = context.window_manager.light_helper_property
-        if not wm_props.linking_tool_active:
-            return
-        if wm_props.linking_tool_overlay_mode == OVERLAY_MODE_OFF:
+        if not wm_props.linking_tool_active or wm_props.linking_tool_overlay_mode == OVERLAY_MODE_OFF:
+            _overlay_groups_cache.clear()
             return
-
-        relevant_names = _collect_overlay_object_names()
-        collection_names = _collect_overlay_collection_names()
-        needs_cache_refresh = False
-        needs_redraw = False
-
-        for update in depsgraph.updates:
-            id_ref = update.id
-            if isinstance(id_ref, bpy.types.Collection):
-                if id_ref.is_evaluated:
-                    id_ref = id_ref.original
-                    if id_ref is None:
-                        continue
-                if id_ref.name in collection_names:
-                    needs_cache_refresh = True
-                    break
-                continue
-
-            if not isinstance(id_ref, bpy.types.Object):
-                continue
-            if id_ref.is_evaluated:
-                id_ref = id_ref.original
-                if id_ref is None:
-                    continue
-            if id_ref.name not in relevant_names:
-                continue
-            if update.is_updated_transform or update.is_updated_geometry:
-                needs_cache_refresh = True
-                break
-
+        if summary.objects or summary.collections:
+            # Cached groups of other subjects are not indexed; drop them.
+            _overlay_groups_cache.clear()
+
+        needs_cache_refresh = not _cache.collection_pointers.isdisjoint(summary.collections)
+        object_rows = _cache.geometry.object_rows
+        moved_rows = set()
+        moved_subjects = set()
+        if not needs_cache_refresh:
+            for pointer in summary.transformed | summary.geometry:
+                moved_rows.update(object_rows.get(pointer, ()))
+                if pointer in _cache.subject_groups:
+                    moved_subjects.add(pointer)
+
+        if moved_rows or moved_subjects:
+            # Membership is unchanged; only boxes and line starts follow the transform.
+            needs_cache_refresh = not _update_moved_targets(moved_rows, moved_subjects)
+            if not needs_cache_refresh:
+                tag_view3d_redraw(context)
         if needs_cache_refresh:
             invalidate_overlay_cache()
             refresh_overlay_cache(context)
             tag_view3d_redraw(context)
-        elif needs_redraw:
-            tag_view3d_redraw(context)
     except (AttributeError, ReferenceError, RuntimeError, TypeError):
         invalidate_overlay_cache()
 
@@ -885,6 +1097,7 @@ def _undo_redo_post(_dummy):
         context = bpy.context
         if context is None or context.window_manager is None:
             return
+        invalidate_pick_index()
         if not context.window_manager.light_helper_property.linking_tool_active:
             return
         invalidate_overlay_cache()
@@ -915,8 +1128,8 @@ def register_draw_handlers():
             _draw_overlay_hud_safe, (), 'WINDOW', 'POST_PIXEL',
         )
     if not _depsgraph_handler_registered:
-        if _depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.append(_depsgraph_update_post)
+        from ..handlers import subscribe_depsgraph
+        subscribe_depsgraph(_depsgraph_update_post)
         _depsgraph_handler_registered = True
     if not _undo_handler_registered:
         if _undo_redo_post not in bpy.app.handlers.undo_post:
@@ -943,8 +1156,8 @@ def unregister_draw_handlers():
         finally:
             _draw_handler_hud = None
     if _depsgraph_handler_registered:
-        if _depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.remove(_depsgraph_update_post)
+        from ..handlers import unsubscribe_depsgraph
+        unsubscribe_depsgraph(_depsgraph_update_post)
         _depsgraph_handler_registered = False
     if _undo_handler_registered:
         if _undo_redo_post in bpy.app.handlers.undo_post:
@@ -953,6 +1166,7 @@ def unregister_draw_handlers():
             bpy.app.handlers.redo_post.remove(_undo_redo_post)
         _undo_handler_registered = False
     invalidate_overlay_cache()
+    invalidate_pick_index()
 
 
 def view3d_window_at_mouse(context: bpy.types.Context, event):
@@ -983,6 +1197,79 @@ def _depth_along_view(origin: Vector, direction: Vector, world_co: Vector) -> fl
     return (world_co - origin).dot(direction)
 
 
+class _PickIndex:
+    """Screen positions of pickable non-mesh objects, bucketed into a grid of pick-radius cells."""
+    __slots__ = ("key", "objects", "positions", "screen", "cells")
+
+    def __init__(self, key, objects, positions, screen, cells):
+        self.key = key
+        self.objects = objects
+        self.positions = positions
+        self.screen = screen
+        self.cells = cells
+
+    def query(self, coord, radius: float) -> list[int]:
+        cx = int(np.floor(coord[0] / PICK_RADIUS_PIXELS))
+        cy = int(np.floor(coord[1] / PICK_RADIUS_PIXELS))
+        hits = []
+        mouse = np.array(coord, np.float32)
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                for index in self.cells.get((x, y), ()):
+                    if np.hypot(*(self.screen[index] - mouse)) <= radius:
+                        hits.append(index)
+        return hits
+
+
+PICK_RADIUS_PIXELS = 22.0
+_pick_index: _PickIndex | None = None
+
+
+def invalidate_pick_index() -> None:
+    global _pick_index
+    _pick_index = None
+
+
+def _build_pick_index(context: bpy.types.Context, region, rv3d, key) -> _PickIndex:
+    objects = []
+    positions = []
+    for obj in context.view_layer.objects:
+        if obj.hide_viewport or obj.hide_get() or not obj.visible_get():
+            continue
+        if obj.type in {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}:
+            continue
+        objects.append(obj)
+        positions.append(obj.matrix_world.translation)
+    positions = np.array(positions, np.float32).reshape(-1, 3)
+
+    # Same projection as view3d_utils.location_3d_to_region_2d, for every object at once.
+    matrix = np.array(rv3d.perspective_matrix, np.float32)
+    clip = positions @ matrix[:, :3].T + matrix[:, 3]
+    in_front = clip[:, 3] > 0.0
+    half_size = np.array((region.width / 2.0, region.height / 2.0), np.float32)
+    screen = half_size + half_size * clip[:, :2] / np.where(in_front, clip[:, 3], 1.0)[:, None]
+
+    cells = {}
+    for index in np.flatnonzero(in_front):
+        cell = (int(screen[index, 0] // PICK_RADIUS_PIXELS), int(screen[index, 1] // PICK_RADIUS_PIXELS))
+        cells.setdefault(cell, []).append(int(index))
+    return _PickIndex(key, objects, positions, screen, cells)
+
+
+def _region_pick_index(context: bpy.types.Context, region, rv3d) -> _PickIndex:
+    """Reuse the grid while the region, its view and the scene objects are unchanged."""
+    global _pick_index
+    key = (
+        region.as_pointer(),
+        region.width,
+        region.height,
+        np.array(rv3d.perspective_matrix, np.float32).tobytes(),
+    )
+    if _pick_index is None or _pick_index.key != key:
+        _pick_index = _build_pick_index(context, region, rv3d, key)
+    return _pick_index
+
+
 def _pick_object_at_coord(context: bpy.types.Context, area, region, coord) -> bpy.types.Object | None:
     from . import resolve_original_id
 
@@ -1005,7 +1292,6 @@ def _pick_object_at_coord(context: bpy.types.Context, area, region, coord) -> bp
         if rv3d is None:
             return None
 
-        mouse = Vector(coord)
         origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, coord)
         direction = view3d_utils.region_2d_to_vector_3d(region, rv3d, coord)
         depsgraph = context.evaluated_depsgraph_get()
@@ -1020,28 +1306,22 @@ def _pick_object_at_coord(context: bpy.types.Context, area, region, coord) -> bp
             if depth > 0:
                 candidates.append((depth, resolve_original_id(hit_obj)))
 
-        pick_radius = 22.0
-        for obj in context.view_layer.objects:
-            if obj.hide_viewport or obj.hide_get() or not obj.visible_get():
-                continue
-            if obj.type in {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}:
-                continue
-
-            screen_co = view3d_utils.location_3d_to_region_2d(region, rv3d, obj.matrix_world.translation)
-            if screen_co is None:
-                continue
-            if (Vector(screen_co) - mouse).length > pick_radius:
-                continue
-
-            depth = _depth_along_view(origin, direction, obj.matrix_world.translation)
+        pick_index = _region_pick_index(context, region, rv3d)
+        for index in pick_index.query(coord, PICK_RADIUS_PIXELS):
+            depth = _depth_along_view(origin, direction, Vector(pick_index.positions[index]))
             if depth > 0:
-                candidates.append((depth, resolve_original_id(obj)))
+                candidates.append((depth, pick_index.objects[index]))
 
         if not candidates:
             return None
 
         candidates.sort(key=lambda item: item[0])
-        return candidates[0][1]
+        try:
+            return resolve_original_id(candidates[0][1])
+        except ReferenceError:
+            # An indexed object was removed without a depsgraph update reaching the overlay.
+            invalidate_pick_index()
+            return None
 
 
 def pick_object_under_mouse(context: bpy.types.Context, event) -> bpy.types.Object | None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from uuid import uuid4
 
@@ -179,87 +180,83 @@ def _parent_group_input(group_input_socket, stack: tuple[_GroupFrame, ...]):
     return parent_input, frame.parent_tree, stack[:-1]
 
 
-def _walk_connected_nodes(
-        input_socket,
-        node_tree: bpy.types.NodeTree,
-        stack: tuple[_GroupFrame, ...],
-        depth: int,
-        max_depth: int,
-        background_ref,
-        ancestry: frozenset,
-        candidates: list,
-        connected_env: list,
-        connected_backgrounds: list,
-) -> None:
-    if input_socket is None or depth > max_depth:
-        return
-    for link in input_socket.links:
-        node = link.from_node
-        output_socket = link.from_socket
-        stack_key = tuple(frame.group_node.as_pointer() for frame in stack)
-        key = (node_tree.as_pointer(), node.as_pointer(), output_socket.identifier, stack_key)
-        if key in ancestry:
-            continue
-        next_ancestry = ancestry | {key}
+def _collect_connected_nodes(surface, node_tree: bpy.types.NodeTree, max_depth: int):
+    """Breadth-first pass over the world graph feeding ``surface``.
 
-        if node.type == "TEX_ENVIRONMENT":
-            connected_env.append((node, stack))
-            if node.image is not None:
-                candidates.append((depth, node, stack, background_ref))
+    Each (tree, node, output, group stack, background) state is expanded once,
+    at the shallowest depth it is reached, so reconverging graphs stay linear.
+    """
+    candidates = []
+    connected_env = []
+    connected_backgrounds = []
+    visited = set()
+    queue = deque(((surface, node_tree, (), (), 0, None, None),))
+    while queue:
+        input_socket, tree, stack, stack_key, depth, background_ref, background_key = queue.popleft()
+        if input_socket is None or depth > max_depth:
             continue
+        tree_pointer = tree.as_pointer()
+        for link in input_socket.links:
+            node = link.from_node
+            output_socket = link.from_socket
+            node_key = (tree_pointer, node.as_pointer(), output_socket.identifier, stack_key)
+            state = (node_key, background_key)
+            if state in visited:
+                continue
+            visited.add(state)
 
-        if node.type == "GROUP" and node.node_tree is not None:
-            inner_input = _group_output_input(node, output_socket)
-            if inner_input is not None:
-                _walk_connected_nodes(
-                    inner_input,
-                    node.node_tree,
-                    stack + (_GroupFrame(node_tree, node),),
-                    depth + 1,
-                    max_depth,
-                    background_ref,
-                    next_ancestry,
-                    candidates,
-                    connected_env,
-                    connected_backgrounds,
-                )
-            continue
+            if node.type == "TEX_ENVIRONMENT":
+                connected_env.append((node, stack))
+                if node.image is not None:
+                    candidates.append((depth, node, stack, background_ref))
+                continue
 
-        if node.type == "GROUP_INPUT":
-            parent_input, parent_tree, parent_stack = _parent_group_input(output_socket, stack)
-            if parent_input is not None:
-                _walk_connected_nodes(
-                    parent_input,
-                    parent_tree,
-                    parent_stack,
-                    depth + 1,
-                    max_depth,
-                    background_ref,
-                    next_ancestry,
-                    candidates,
-                    connected_env,
-                    connected_backgrounds,
-                )
-            continue
+            if node.type == "GROUP" and node.node_tree is not None:
+                inner_input = _group_output_input(node, output_socket)
+                if inner_input is not None:
+                    queue.append((
+                        inner_input,
+                        node.node_tree,
+                        stack + (_GroupFrame(tree, node),),
+                        stack_key + (node.as_pointer(),),
+                        depth + 1,
+                        background_ref,
+                        background_key,
+                    ))
+                continue
 
-        next_background = background_ref
-        if node.type == "BACKGROUND":
-            next_background = (node, stack)
-            connected_backgrounds.append((depth, node, stack))
-        for node_input in node.inputs:
-            if node_input.is_linked:
-                _walk_connected_nodes(
-                    node_input,
-                    node_tree,
-                    stack,
-                    depth + 1,
-                    max_depth,
-                    next_background,
-                    next_ancestry,
-                    candidates,
-                    connected_env,
-                    connected_backgrounds,
-                )
+            if node.type == "GROUP_INPUT":
+                parent_input, parent_tree, parent_stack = _parent_group_input(output_socket, stack)
+                if parent_input is not None:
+                    queue.append((
+                        parent_input,
+                        parent_tree,
+                        parent_stack,
+                        stack_key[:-1],
+                        depth + 1,
+                        background_ref,
+                        background_key,
+                    ))
+                continue
+
+            next_background = background_ref
+            next_background_key = background_key
+            if node.type == "BACKGROUND":
+                next_background = (node, stack)
+                next_background_key = node_key
+                connected_backgrounds.append((depth, node, stack))
+            for node_input in node.inputs:
+                if node_input.is_linked:
+                    queue.append((
+                        node_input,
+                        tree,
+                        stack,
+                        stack_key,
+                        depth + 1,
+                        next_background,
+                        next_background_key,
+                    ))
+    return candidates, connected_env, connected_backgrounds
 
 
 def _find_upstream_node(
@@ -352,13 +349,32 @@ def _resolve_socket_value(
         stack: tuple[_GroupFrame, ...],
         depth: int = 0,
         visited: set | None = None,
+        memo: dict | None = None,
 ):
-    if input_socket is None or depth > DEFAULT_SEARCH_DEPTH:
-        return None
+    """Constant value feeding ``input_socket``, or None when it is not a plain constant.
+
+    ``memo`` maps (tree, node, output, group stack) to resolved values; sharing one
+    across calls keeps reconverging Combine XYZ and group graphs from being re-walked.
+    """
+    return _resolve_socket(input_socket, node_tree, stack, depth, visited, memo)[0]
+
+
+# How a resolved value was reached; the larger status wins when results combine.
+_RESOLVED = 0
+_DEPTH_LIMITED = 1
+_CYCLE_LIMITED = 2
+
+
+def _resolve_socket(input_socket, node_tree, stack, depth, visited, memo):
+    """``(value, status)``; a limited value may differ when the node is reached another way."""
+    if input_socket is None:
+        return None, _RESOLVED
+    if depth > DEFAULT_SEARCH_DEPTH:
+        return None, _DEPTH_LIMITED
     if visited is None:
         visited = set()
     if not input_socket.is_linked:
-        return _socket_default(input_socket)
+        return _socket_default(input_socket), _RESOLVED
 
     link = input_socket.links[0]
     node = link.from_node
@@ -370,33 +386,50 @@ def _resolve_socket_value(
         tuple(frame.group_node.as_pointer() for frame in stack),
     )
     if key in visited:
-        return None
+        return None, _CYCLE_LIMITED
+    # Values cut short by the depth limit only hold for the depth they were reached at.
+    depth_key = key + (depth,)
+    if memo is not None:
+        if key in memo:
+            return memo[key], _RESOLVED
+        if depth_key in memo:
+            return memo[depth_key], _DEPTH_LIMITED
     visited.add(key)
+    value, status = _resolve_output_value(node, output_socket, node_tree, stack, depth, visited, memo)
+    if memo is not None and status != _CYCLE_LIMITED:
+        memo[key if status == _RESOLVED else depth_key] = value
+    return value, status
+
 
+def _resolve_output_value(node, output_socket, node_tree, stack, depth, visited, memo):
     if node.type == "GROUP_INPUT":
         parent_input, parent_tree, parent_stack = _parent_group_input(output_socket, stack)
-        return _resolve_socket_value(parent_input, parent_tree, parent_stack, depth + 1, visited)
+        return _resolve_socket(parent_input, parent_tree, parent_stack, depth + 1, visited, memo)
     if node.type == "VALUE":
-        return _socket_default(output_socket)
+        return _socket_default(output_socket), _RESOLVED
     if node.type == "RGB":
-        return _socket_default(output_socket)
+        return _socket_default(output_socket), _RESOLVED
     if node.type == "COMBXYZ":
-        values = [
-            _resolve_socket_value(node.inputs[index], node_tree, stack, depth + 1, visited.copy())
+        results = [
+            _resolve_socket(node.inputs[index], node_tree, stack, depth + 1, visited.copy(), memo)
             for index in range(min(3, len(node.inputs)))
         ]
+        status = max((status for _, status in results), default=_RESOLVED)
+        values = [value for value, _ in results]
         if len(values) == 3 and all(isinstance(value, (int, float)) for value in values):
-            return tuple(float(value) for value in values)
+            return tuple(float(value) for value in values), status
+        return None, status
     if node.type == "GROUP" and node.node_tree is not None:
         inner_input = _group_output_input(node, output_socket)
-        return _resolve_socket_value(
+        return _resolve_socket(
             inner_input,
             node.node_tree,
             stack + (_GroupFrame(node_tree, node),),
             depth + 1,
             visited,
+            memo,
         )
-    return None
+    return None, _RESOLVED
 
 
 def _vector3(value, default):
@@ -412,6 +445,7 @@ def _vector3(value, default):
 def _group_control_value(
         stack: tuple[_GroupFrame, ...],
         names: tuple[str, ...],
+        memo: dict | None = None,
 ):
     for index, frame in enumerate(stack):
         for name in names:
@@ -422,6 +456,7 @@ def _group_control_value(
                 socket,
                 frame.parent_tree,
                 stack[:index],
+                memo=memo,
             )
             if value is not None:
                 return value
@@ -461,20 +496,12 @@ def find_world_environment(scene: bpy.types.Scene, max_depth: int = DEFAULT_SEAR
     if surface is None or not surface.is_linked:
         return info
 
-    candidates = []
-    connected_env = []
-    connected_backgrounds = []
-    _walk_connected_nodes(
+    # Constant inputs resolved below, shared so no part of the graph is resolved twice.
+    resolved_values = {}
+    candidates, connected_env, connected_backgrounds = _collect_connected_nodes(
         surface,
         world.node_tree,
-        (),
-        0,
         max_depth,
-        None,
-        frozenset(),
-        candidates,
-        connected_env,
-        connected_backgrounds,
     )
     environment_instances = {
         (
@@ -504,6 +531,7 @@ def find_world_environment(scene: bpy.types.Scene, max_depth: int = DEFAULT_SEAR
             color_socket,
             background.id_data,
             background_stack,
+            memo=resolved_values,
         )
         # An empty connected Environment Texture has no usable color output.
         # In that specific case, use the Background socket's fallback color.
@@ -522,6 +550,7 @@ def find_world_environment(scene: bpy.types.Scene, max_depth: int = DEFAULT_SEAR
             background.inputs.get("Strength"),
             background.id_data,
             background_stack,
+            memo=resolved_values,
         )
         if isinstance(strength, (int, float)):
             info.strength = max(0.0, float(strength))
@@ -540,18 +569,18 @@ def find_world_environment(scene: bpy.types.Scene, max_depth: int = DEFAULT_SEAR
     info.group_stack = env_stack
     info.projection = getattr(env_node, "projection", "EQUIRECTANGULAR")
     info.interpolation = getattr(env_node, "interpolation", "Linear")
-    group_strength = _group_control_value(env_stack, ("天空强度", "Sky Strength", "Strength"))
+    group_strength = _group_control_value(env_stack, ("天空强度", "Sky Strength", "Strength"), resolved_values)
     if isinstance(group_strength, (int, float)):
         info.strength = max(0.0, float(group_strength))
-    group_gamma = _group_control_value(env_stack, ("Gamma",))
+    group_gamma = _group_control_value(env_stack, ("Gamma",), resolved_values)
     if isinstance(group_gamma, (int, float)):
         info.gamma = max(0.001, float(group_gamma))
-    group_saturation = _group_control_value(env_stack, ("Saturation", "饱和度"))
+    group_saturation = _group_control_value(env_stack, ("Saturation", "饱和度"), resolved_values)
     if isinstance(group_saturation, (int, float)):
         info.saturation = max(0.0, float(group_saturation))
-    group_tint = _group_control_value(env_stack, ("着色", "Tint"))
+    group_tint = _group_control_value(env_stack, ("着色", "Tint"), resolved_values)
     info.tint = _vector3(group_tint, info.tint)
-    group_tint_factor = _group_control_value(env_stack, ("着色系数", "Tint Factor"))
+    group_tint_factor = _group_control_value(env_stack, ("着色系数", "Tint Factor"), resolved_values)
     if isinstance(group_tint_factor, (int, float)):
         info.tint_factor = max(0.0, min(1.0, float(group_tint_factor)))
     if background_ref is not None:
@@ -561,6 +590,7 @@ def find_world_environment(scene: bpy.types.Scene, max_depth: int = DEFAULT_SEAR
             strength_socket,
             info.background_node.id_data,
             info.background_stack,
+            memo=resolved_values,
         )
         if isinstance(resolved, (int, float)):
             info.strength = max(0.0, float(resolved))
@@ -577,15 +607,30 @@ def find_world_environment(scene: bpy.types.Scene, max_depth: int = DEFAULT_SEAR
         info.mapping_node = mapping
         info.mapping_stack = mapping_stack
         info.location = _vector3(
-            _resolve_socket_value(mapping.inputs.get("Location"), mapping.id_data, mapping_stack),
+            _resolve_socket_value(
+                mapping.inputs.get("Location"),
+                mapping.id_data,
+                mapping_stack,
+                memo=resolved_values,
+            ),
             info.location,
         )
         info.rotation = _vector3(
-            _resolve_socket_value(mapping.inputs.get("Rotation"), mapping.id_data, mapping_stack),
+            _resolve_socket_value(
+                mapping.inputs.get("Rotation"),
+                mapping.id_data,
+                mapping_stack,
+                memo=resolved_values,
+            ),
             info.rotation,
         )
         info.scale = _vector3(
-            _resolve_socket_value(mapping.inputs.get("Scale"), mapping.id_data, mapping_stack),
+            _resolve_socket_value(
+                mapping.inputs.get("Scale"),
+                mapping.id_data,
+                mapping_stack,
+                memo=resolved_values,
+            ),
             info.scale,
         )
     return info
@@ -1807,7 +1852,7 @@ _syncing_suns = False
 _sun_sync_engine_by_scene = {}
 
 
-def sync_world_environment_suns_from_depsgraph(scene, depsgraph) -> None:
+def sync_world_environment_suns_from_summary(scene, summary) -> None:
     global _syncing_suns
     if _syncing_suns or scene is None:
         return
@@ -1827,18 +1872,16 @@ def sync_world_environment_suns_from_depsgraph(scene, depsgraph) -> None:
         finally:
             _syncing_suns = False
         return
-    candidates = []
-    for update in depsgraph.updates:
-        id_ref = update.id
-        if isinstance(id_ref, bpy.types.Object):
-            obj = id_ref.original if id_ref.is_evaluated else id_ref
-            if obj and obj.type == "LIGHT" and obj.data is not None and obj.data.type == "SUN":
-                candidates.append(obj)
-        elif isinstance(id_ref, bpy.types.Light) and id_ref.type == "SUN":
-            candidates.extend(
-                obj for obj in scene.objects
-                if obj.type == "LIGHT" and obj.data == id_ref
-            )
+    candidates = [
+        obj for obj in summary.objects.values()
+        if obj.type == "LIGHT" and obj.data is not None and obj.data.type == "SUN"
+    ]
+    sun_data = [light for light in summary.lights.values() if light.type == "SUN"]
+    if sun_data:
+        candidates.extend(
+            obj for obj in scene.objects
+            if obj.type == "LIGHT" and obj.data in sun_data
+        )
     if not candidates:
         return
     unique = list(dict.fromkeys(candidates))